@@ -1,14 +1,127 @@
-import colorsys
+import functools
 import struct
 
+# Packet header shared by every command: total length, 2 bytes padding and the 4 character command name
+_HEADER = struct.Struct('>H 2x 4s')
+
+
+@functools.lru_cache(maxsize=256)
+def _rgb_to_hls(r, g, b):
+    """
+    Same algorithm as colorsys.rgb_to_hls, with the min()/max() builtin calls and the intermediate rc/gc/bc terms
+    inlined. Lighting looks tend to reuse the same handful of colors so the results are cached as well.
+    """
+    maxc = r if r > g else g
+    if b > maxc:
+        maxc = b
+    minc = r if r < g else g
+    if b < minc:
+        minc = b
+    sumc = maxc + minc
+    rangec = maxc - minc
+    l = sumc / 2.0
+    if minc == maxc:
+        return 0.0, l, 0.0
+    if l <= 0.5:
+        s = rangec / sumc
+    else:
+        s = rangec / (2.0 - maxc - minc)
+    if r == maxc:
+        h = (maxc - b) / rangec - (maxc - g) / rangec
+    elif g == maxc:
+        h = 2.0 + (maxc - r) / rangec - (maxc - b) / rangec
+    else:
+        h = 4.0 + (maxc - g) / rangec - (maxc - r) / rangec
+    return (h / 6.0) % 1.0, l, s
+
+
+@functools.lru_cache(maxsize=64)
+def _camera_data_struct(count, code):
+    """
+    Layout of a CCmd data block: count values of the struct format code, or one string of count bytes for code 's'.
+    The block is zero padded to at least 8 bytes. A camera control session only uses a few shapes, the cache is
+    bounded since string lengths come from the caller.
+    """
+    fmt = '>{}{}'.format(count, code)
+    padding = 8 - struct.calcsize(fmt)
+    if padding > 0:
+        fmt += ' {}x'.format(padding)
+    return struct.Struct(fmt)
+
 
 class Command:
+    __slots__ = ()
+
+    _NAME = None
+    _CACHE_PACKETS = False
+    # Leading payload values that never change for a command, like a mask that is always 1
+    _FIXED_ARGS = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Fuse the packet header with the payload layout so a command is built with a single pack call. The
+        # header fields are constant per class so they're bound in advance, _emit(*payload) then runs entirely
+        # in C without an extra Python frame.
+        if '_STRUCT' in cls.__dict__ and cls._NAME is not None:
+            cls._PACKET = struct.Struct(_HEADER.format + ' ' + cls._STRUCT.format.lstrip('>'))
+            cls._HEAD_ARGS = (cls._PACKET.size, cls._NAME) + cls._FIXED_ARGS
+            cls._emit = functools.partial(cls._PACKET.pack, *cls._HEAD_ARGS)
+
+            # Commands with only a few possible argument combinations, like triggers that only take an index or the
+            # keyer on-air/source selection that gets re-sent to keep state in sync, encode to the same few packets
+            # over and over. Keep those around, keyed on the payload values so reassigned fields still take effect.
+            if cls._CACHE_PACKETS:
+                cls._emit = staticmethod(functools.lru_cache(maxsize=64, typed=True)(cls._emit))
+
+    def _pack_args(self):
+        """
+        Payload values of the command in _STRUCT order, without the _FIXED_ARGS. Every command implements this, the
+        encoders below share it so the values are gathered in one place.
+        """
+        raise NotImplementedError
+
+    def _packet_size(self):
+        return self._PACKET.size
+
     def get_command(self):
-        pass
+        return self._emit(*self._pack_args())
+
+    @staticmethod
+    def pack_many(commands):
+        """
+        Encode a batch of commands into a single buffer, for sending multiple commands in one packet. The buffer is
+        sized up front and every command is packed straight into it.
+
+        :param commands: Iterable of Command instances
+        :return: bytearray with the command packets back-to-back
+        """
+        commands = list(commands)
+        buffer = bytearray(sum([command._packet_size() for command in commands]))
+        offset = 0
+        for command in commands:
+            offset += command.get_command_into(buffer, offset)
+        return buffer
+
+    def get_command_into(self, buffer, offset=0):
+        """
+        Write the encoded command into a caller owned buffer, so a network layer can pack multiple commands
+        back-to-back into a single preallocated packet buffer. The packet is packed in place, no intermediate bytes
+        object is created.
+
+        :param buffer: Writable bytearray or memoryview
+        :param offset: Position in the buffer to write the command at
+        :return: Number of bytes written
+        :raises struct.error: The command does not fit in the buffer at offset
+        """
+        self._PACKET.pack_into(buffer, offset, *self._HEAD_ARGS, *self._pack_args())
+        return self._PACKET.size
 
     def _make_command(self, name, data):
-        header = struct.pack('>H 2x 4s', len(data) + 8, name.encode())
-        return header + data
+        # Not used by the commands in this module anymore, kept for subclasses that build their own packets. Those
+        # pass the name as a str like 'CTDv', bytes are accepted as well.
+        if isinstance(name, str):
+            name = name.encode()
+        return _HEADER.pack(len(data) + 8, name) + data
 
 
 class CutCommand(Command):
@@ -24,15 +137,19 @@ class CutCommand(Command):
 
     """
 
+    __slots__ = ('index',)
+    _NAME = b'DCut'
+    _STRUCT = struct.Struct('>B 3x')
+    _CACHE_PACKETS = True
+
     def __init__(self, index):
         """
         :param index: 0-indexed M/E number to send the CUT to
         """
         self.index = index
 
-    def get_command(self):
-        data = struct.pack('>B 3x', self.index)
-        return self._make_command('DCut', data)
+    def _pack_args(self):
+        return (self.index,)
 
 
 class AutoCommand(Command):
@@ -48,15 +165,19 @@ class AutoCommand(Command):
 
     """
 
+    __slots__ = ('index',)
+    _NAME = b'DAut'
+    _STRUCT = struct.Struct('>B 3x')
+    _CACHE_PACKETS = True
+
     def __init__(self, index):
         """
         :param index: 0-indexed M/E number to send the AUTO transition to
         """
         self.index = index
 
-    def get_command(self):
-        data = struct.pack('>B 3x', self.index)
-        return self._make_command('DAut', data)
+    def _pack_args(self):
+        return (self.index,)
 
 
 class ProgramInputCommand(Command):
@@ -74,6 +195,10 @@ class ProgramInputCommand(Command):
 
     """
 
+    __slots__ = ('index', 'source')
+    _NAME = b'CPgI'
+    _STRUCT = struct.Struct('>B x H')
+
     def __init__(self, index, source):
         """
         :param index: 0-indexed M/E number to control the program bus of
@@ -82,9 +207,8 @@ class ProgramInputCommand(Command):
         self.index = index
         self.source = source
 
-    def get_command(self):
-        data = struct.pack('>B x H', self.index, self.source)
-        return self._make_command('CPgI', data)
+    def _pack_args(self):
+        return (self.index, self.source)
 
 
 class PreviewInputCommand(Command):
@@ -102,6 +226,10 @@ class PreviewInputCommand(Command):
 
     """
 
+    __slots__ = ('index', 'source')
+    _NAME = b'CPvI'
+    _STRUCT = struct.Struct('>B x H')
+
     def __init__(self, index, source):
         """
         :param index: 0-indexed M/E number to control the preview bus of
@@ -110,9 +238,8 @@ class PreviewInputCommand(Command):
         self.index = index
         self.source = source
 
-    def get_command(self):
-        data = struct.pack('>B x H', self.index, self.source)
-        return self._make_command('CPvI', data)
+    def _pack_args(self):
+        return (self.index, self.source)
 
 
 class AuxSourceCommand(Command):
@@ -129,6 +256,11 @@ class AuxSourceCommand(Command):
 
     """
 
+    __slots__ = ('index', 'source')
+    _NAME = b'CAuS'
+    _STRUCT = struct.Struct('>BBH')
+    _FIXED_ARGS = (1,)
+
     def __init__(self, index, source):
         """
         :param index: 0-indexed AUX output number
@@ -137,9 +269,8 @@ class AuxSourceCommand(Command):
         self.index = index
         self.source = source
 
-    def get_command(self):
-        data = struct.pack('>BBH', 1, self.index, self.source)
-        return self._make_command('CAuS', data)
+    def _pack_args(self):
+        return (self.index, self.source)
 
 
 class TransitionPositionCommand(Command):
@@ -156,6 +287,10 @@ class TransitionPositionCommand(Command):
 
     """
 
+    __slots__ = ('index', 'position')
+    _NAME = b'CTPs'
+    _STRUCT = struct.Struct('>BxH')
+
     def __init__(self, index, position):
         """
         :param index: 0-indexed M/E number to control the transition of
@@ -164,10 +299,9 @@ class TransitionPositionCommand(Command):
         self.index = index
         self.position = position
 
-    def get_command(self):
+    def _pack_args(self):
         position = self.position
-        data = struct.pack('>BxH', self.index, position)
-        return self._make_command('CTPs', data)
+        return (self.index, position)
 
 
 class TransitionSettingsCommand(Command):
@@ -206,6 +340,10 @@ class TransitionSettingsCommand(Command):
 
     """
 
+    __slots__ = ('index', 'style', 'next_transition')
+    _NAME = b'CTTp'
+    _STRUCT = struct.Struct('>BBBB')
+
     def __init__(self, index, style=None, next_transition=None):
         """
         :param index: 0-indexed M/E number to control the preview bus of
@@ -217,17 +355,19 @@ class TransitionSettingsCommand(Command):
         self.style = style
         self.next_transition = next_transition
 
-    def get_command(self):
+    def _pack_args(self):
         mask = 0
-        if self.style is not None:
+        style = self.style
+        if style is None:
+            style = 0
+        else:
             mask |= 0x01
-        if self.next_transition is not None:
+        next_transition = self.next_transition
+        if next_transition is None:
+            next_transition = 0
+        else:
             mask |= 0x02
-
-        style = 0 if self.style is None else self.style
-        next_transition = 0 if self.next_transition is None else self.next_transition
-        data = struct.pack('>BBBB', mask, self.index, style, next_transition)
-        return self._make_command('CTTp', data)
+        return (mask, self.index, style, next_transition)
 
 
 class TransitionPreviewCommand(Command):
@@ -244,6 +384,10 @@ class TransitionPreviewCommand(Command):
 
     """
 
+    __slots__ = ('index', 'enabled')
+    _NAME = b'CTPr'
+    _STRUCT = struct.Struct('>B ? 2x')
+
     def __init__(self, index, enabled):
         """
         :param index: 0-indexed M/E number to control the preview bus of
@@ -252,9 +396,8 @@ class TransitionPreviewCommand(Command):
         self.index = index
         self.enabled = enabled
 
-    def get_command(self):
-        data = struct.pack('>B ? 2x', self.index, self.enabled)
-        return self._make_command('CTPr', data)
+    def _pack_args(self):
+        return (self.index, self.enabled)
 
 
 class ColorGeneratorCommand(Command):
@@ -273,6 +416,10 @@ class ColorGeneratorCommand(Command):
 
     """
 
+    __slots__ = ('index', '_hue', '_hue_scaled', '_saturation', '_saturation_scaled', '_luma', '_luma_scaled')
+    _NAME = b'CClV'
+    _STRUCT = struct.Struct('>BB 3H')
+
     def __init__(self, index, hue=None, saturation=None, luma=None):
         """
         :param index: Color generator index
@@ -285,25 +432,57 @@ class ColorGeneratorCommand(Command):
         self.luma = luma
         self.saturation = saturation
 
+    @property
+    def hue(self):
+        return self._hue
+
+    @hue.setter
+    def hue(self, value):
+        # The wire format scaling is done once here so get_command does no arithmetic
+        self._hue = value
+        self._hue_scaled = None if value is None else int(value * 10)
+
+    @property
+    def saturation(self):
+        return self._saturation
+
+    @saturation.setter
+    def saturation(self, value):
+        self._saturation = value
+        self._saturation_scaled = None if value is None else int(value * 1000)
+
+    @property
+    def luma(self):
+        return self._luma
+
+    @luma.setter
+    def luma(self, value):
+        self._luma = value
+        self._luma_scaled = None if value is None else int(value * 1000)
+
     @classmethod
     def from_rgb(cls, index, red, green, blue):
-        h, l, s = colorsys.rgb_to_hls(red, green, blue)
+        h, l, s = _rgb_to_hls(red, green, blue)
         return cls(index, hue=h * 359, saturation=s, luma=l)
 
-    def get_command(self):
+    def _pack_args(self):
         mask = 0
-        if self.hue is not None:
+        hue = self._hue_scaled
+        if hue is None:
+            hue = 0
+        else:
             mask |= 0x01
-        if self.saturation is not None:
+        saturation = self._saturation_scaled
+        if saturation is None:
+            saturation = 0
+        else:
             mask |= 0x02
-        if self.luma is not None:
+        luma = self._luma_scaled
+        if luma is None:
+            luma = 0
+        else:
             mask |= 0x04
-
-        hue = 0 if self.hue is None else int(self.hue * 10)
-        saturation = 0 if self.saturation is None else int(self.saturation * 1000)
-        luma = 0 if self.luma is None else int(self.luma * 1000)
-        data = struct.pack('>BB 3H', mask, self.index, hue, saturation, luma)
-        return self._make_command('CClV', data)
+        return (mask, self.index, hue, saturation, luma)
 
 
 class FadeToBlackCommand(Command):
@@ -321,15 +500,19 @@ class FadeToBlackCommand(Command):
 
     """
 
+    __slots__ = ('index',)
+    _NAME = b'FtbA'
+    _STRUCT = struct.Struct('>B 3x')
+    _CACHE_PACKETS = True
+
     def __init__(self, index):
         """
         :param index: 0-indexed M/E number to trigger FtB on
         """
         self.index = index
 
-    def get_command(self):
-        data = struct.pack('>B 3x', self.index)
-        return self._make_command('FtbA', data)
+    def _pack_args(self):
+        return (self.index,)
 
 
 class FadeToBlackConfigCommand(Command):
@@ -347,6 +530,11 @@ class FadeToBlackConfigCommand(Command):
 
     """
 
+    __slots__ = ('index', 'frames')
+    _NAME = b'FtbC'
+    _STRUCT = struct.Struct('>BBBx')
+    _FIXED_ARGS = (1,)
+
     def __init__(self, index, frames):
         """
         :param index: 0-indexed M/E number to configure
@@ -355,9 +543,8 @@ class FadeToBlackConfigCommand(Command):
         self.index = index
         self.frames = frames
 
-    def get_command(self):
-        data = struct.pack('>BBBx', 1, self.index, self.frames)
-        return self._make_command('FtbC', data)
+    def _pack_args(self):
+        return (self.index, self.frames)
 
 
 class CaptureStillCommand(Command):
@@ -372,8 +559,13 @@ class CaptureStillCommand(Command):
 
     """
 
-    def get_command(self):
-        return self._make_command('Capt', b'')
+    __slots__ = ()
+    _NAME = b'Capt'
+    _STRUCT = struct.Struct('>')
+    _CACHE_PACKETS = True
+
+    def _pack_args(self):
+        return ()
 
 
 class MediaplayerSelectCommand(Command):
@@ -393,6 +585,10 @@ class MediaplayerSelectCommand(Command):
 
     """
 
+    __slots__ = ('index', 'still', 'clip', 'source_type')
+    _NAME = b'MPSS'
+    _STRUCT = struct.Struct('>BBBBBxxx')
+
     def __init__(self, index, still=None, clip=None):
         """
         :param index: Mediaplayer index
@@ -411,18 +607,19 @@ class MediaplayerSelectCommand(Command):
         else:
             self.source_type = 2
 
-    def get_command(self):
+    def _pack_args(self):
         mask = 1
-        if self.still is not None:
+        still = self.still
+        if still is None:
+            still = 0
+        else:
             mask |= 1 << 1
-        if self.clip is not None:
+        clip = self.clip
+        if clip is None:
+            clip = 0
+        else:
             mask |= 1 << 2
-
-        still = self.still if self.still is not None else 0
-        clip = self.clip if self.clip is not None else 0
-
-        data = struct.pack('>BBBBBxxx', mask, self.index, self.source_type, still, clip)
-        return self._make_command('MPSS', data)
+        return (mask, self.index, self.source_type, still, clip)
 
 
 class DkeyOnairCommand(Command):
@@ -440,6 +637,10 @@ class DkeyOnairCommand(Command):
 
     """
 
+    __slots__ = ('index', 'on_air')
+    _NAME = b'CDsL'
+    _STRUCT = struct.Struct('>B?xx')
+
     def __init__(self, index, on_air):
         """
         :param index: 0-indexed DSK number to control
@@ -448,9 +649,8 @@ class DkeyOnairCommand(Command):
         self.index = index
         self.on_air = on_air
 
-    def get_command(self):
-        data = struct.pack('>B?xx', self.index, self.on_air)
-        return self._make_command('CDsL', data)
+    def _pack_args(self):
+        return (self.index, self.on_air)
 
 
 class DkeyTieCommand(Command):
@@ -468,6 +668,10 @@ class DkeyTieCommand(Command):
 
     """
 
+    __slots__ = ('index', 'tie')
+    _NAME = b'CDsT'
+    _STRUCT = struct.Struct('>B?xx')
+
     def __init__(self, index, tie):
         """
         :param index: 0-indexed DSK number to control
@@ -476,9 +680,8 @@ class DkeyTieCommand(Command):
         self.index = index
         self.tie = tie
 
-    def get_command(self):
-        data = struct.pack('>B?xx', self.index, self.tie)
-        return self._make_command('CDsT', data)
+    def _pack_args(self):
+        return (self.index, self.tie)
 
 
 class DkeyAutoCommand(Command):
@@ -495,15 +698,19 @@ class DkeyAutoCommand(Command):
 
     """
 
+    __slots__ = ('index',)
+    _NAME = b'DDsA'
+    _STRUCT = struct.Struct('>Bxxx')
+    _CACHE_PACKETS = True
+
     def __init__(self, index):
         """
         :param index: 0-indexed DSK number to trigger
         """
         self.index = index
 
-    def get_command(self):
-        data = struct.pack('>Bxxx', self.index)
-        return self._make_command('DDsA', data)
+    def _pack_args(self):
+        return (self.index,)
 
 
 class DkeyRateCommand(Command):
@@ -521,6 +728,10 @@ class DkeyRateCommand(Command):
 
     """
 
+    __slots__ = ('index', 'rate')
+    _NAME = b'CDsR'
+    _STRUCT = struct.Struct('>BBxx')
+
     def __init__(self, index, rate):
         """
         :param index: 0-indexed DSK number to change
@@ -529,9 +740,8 @@ class DkeyRateCommand(Command):
         self.index = index
         self.rate = rate
 
-    def get_command(self):
-        data = struct.pack('>BBxx', self.index, self.rate)
-        return self._make_command('CDsR', data)
+    def _pack_args(self):
+        return (self.index, self.rate)
 
 
 class DkeySetFillCommand(Command):
@@ -549,6 +759,10 @@ class DkeySetFillCommand(Command):
 
     """
 
+    __slots__ = ('index', 'source')
+    _NAME = b'CDsF'
+    _STRUCT = struct.Struct('>BxH')
+
     def __init__(self, index, source):
         """
         :param index: 0-indexed DSK number to control
@@ -557,9 +771,8 @@ class DkeySetFillCommand(Command):
         self.index = index
         self.source = source
 
-    def get_command(self):
-        data = struct.pack('>BxH', self.index, self.source)
-        return self._make_command('CDsF', data)
+    def _pack_args(self):
+        return (self.index, self.source)
 
 
 class DkeySetKeyCommand(Command):
@@ -577,6 +790,10 @@ class DkeySetKeyCommand(Command):
 
     """
 
+    __slots__ = ('index', 'source')
+    _NAME = b'CDsC'
+    _STRUCT = struct.Struct('>BxH')
+
     def __init__(self, index, source):
         """
         :param index: 0-indexed DSK number to control
@@ -585,9 +802,8 @@ class DkeySetKeyCommand(Command):
         self.index = index
         self.source = source
 
-    def get_command(self):
-        data = struct.pack('>BxH', self.index, self.source)
-        return self._make_command('CDsC', data)
+    def _pack_args(self):
+        return (self.index, self.source)
 
 
 class DkeyGainCommand(Command):
@@ -619,6 +835,10 @@ class DkeyGainCommand(Command):
 
     """
 
+    __slots__ = ('index', 'premultiplied', 'clip', 'gain', 'invert')
+    _NAME = b'CDsG'
+    _STRUCT = struct.Struct('>BB ?x H H ?3x')
+
     def __init__(self, index, premultiplied=None, clip=None, gain=None, invert=None):
         """
         :param index: 0-indexed DSK number to control
@@ -633,23 +853,29 @@ class DkeyGainCommand(Command):
         self.gain = gain
         self.invert = invert
 
-    def get_command(self):
+    def _pack_args(self):
         mask = 0
-        if self.premultiplied is not None:
+        premultiplied = self.premultiplied
+        if premultiplied is None:
+            premultiplied = False
+        else:
             mask |= 0x01
-        if self.clip is not None:
+        clip = self.clip
+        if clip is None:
+            clip = 0
+        else:
             mask |= 0x02
-        if self.gain is not None:
+        gain = self.gain
+        if gain is None:
+            gain = 0
+        else:
             mask |= 0x04
-        if self.invert is not None:
+        invert = self.invert
+        if invert is None:
+            invert = False
+        else:
             mask |= 0x08
-
-        premultiplied = False if self.premultiplied is None else self.premultiplied
-        invert = False if self.invert is None else self.invert
-        clip = 0 if self.clip is None else self.clip
-        gain = 0 if self.gain is None else self.gain
-        data = struct.pack('>BB ?x H H ?3x', mask, self.index, premultiplied, clip, gain, invert)
-        return self._make_command('CDsG', data)
+        return (mask, self.index, premultiplied, clip, gain, invert)
 
 
 class DkeyMaskCommand(Command):
@@ -681,6 +907,10 @@ class DkeyMaskCommand(Command):
 
     """
 
+    __slots__ = ('index', 'enabled', 'top', 'bottom', 'left', 'right')
+    _NAME = b'CDsM'
+    _STRUCT = struct.Struct('>BB ?x 4h')
+
     def __init__(self, index, enabled=None, top=None, bottom=None, left=None, right=None):
         """
         :param index: 0-indexed DSK number to control
@@ -697,26 +927,34 @@ class DkeyMaskCommand(Command):
         self.left = left
         self.right = right
 
-    def get_command(self):
+    def _pack_args(self):
         mask = 0
-        if self.enabled is not None:
+        enabled = self.enabled
+        if enabled is None:
+            enabled = False
+        else:
             mask |= 0x01
-        if self.top is not None:
+        top = self.top
+        if top is None:
+            top = 0
+        else:
             mask |= 0x02
-        if self.bottom is not None:
+        bottom = self.bottom
+        if bottom is None:
+            bottom = 0
+        else:
             mask |= 0x04
-        if self.left is not None:
+        left = self.left
+        if left is None:
+            left = 0
+        else:
             mask |= 0x08
-        if self.right is not None:
+        right = self.right
+        if right is None:
+            right = 0
+        else:
             mask |= 0x10
-
-        enabled = False if self.enabled is None else self.enabled
-        top = 0 if self.top is None else self.top
-        bottom = 0 if self.bottom is None else self.bottom
-        left = 0 if self.left is None else self.left
-        right = 0 if self.right is None else self.right
-        data = struct.pack('>BB ?x 4h', mask, self.index, enabled, top, bottom, left, right)
-        return self._make_command('CDsM', data)
+        return (mask, self.index, enabled, top, bottom, left, right)
 
 
 class MixSettingsCommand(Command):
@@ -734,6 +972,10 @@ class MixSettingsCommand(Command):
 
     """
 
+    __slots__ = ('index', 'rate')
+    _NAME = b'CTMx'
+    _STRUCT = struct.Struct('>BBxx')
+
     def __init__(self, index, rate):
         """
         :param index: 0-indexed DSK number to trigger
@@ -742,9 +984,8 @@ class MixSettingsCommand(Command):
         self.index = index
         self.rate = rate
 
-    def get_command(self):
-        data = struct.pack('>BBxx', self.index, self.rate)
-        return self._make_command('CTMx', data)
+    def _pack_args(self):
+        return (self.index, self.rate)
 
 
 class DipSettingsCommand(Command):
@@ -765,6 +1006,10 @@ class DipSettingsCommand(Command):
 
     """
 
+    __slots__ = ('index', 'rate', 'source')
+    _NAME = b'CTDp'
+    _STRUCT = struct.Struct('>BBBx H 2x')
+
     def __init__(self, index, rate=None, source=None):
         """
         :param index: 0-indexed M/E number to control the preview bus of
@@ -776,17 +1021,19 @@ class DipSettingsCommand(Command):
         self.rate = rate
         self.source = source
 
-    def get_command(self):
+    def _pack_args(self):
         mask = 0
-        if self.rate is not None:
+        rate = self.rate
+        if rate is None:
+            rate = 0
+        else:
             mask |= 0x01
-        if self.source is not None:
+        source = self.source
+        if source is None:
+            source = 0
+        else:
             mask |= 0x02
-
-        rate = 0 if self.rate is None else self.rate
-        source = 0 if self.source is None else self.source
-        data = struct.pack('>BBBx H 2x', mask, self.index, rate, source)
-        return self._make_command('CTDp', data)
+        return (mask, self.index, rate, source)
 
 
 class WipeSettingsCommand(Command):
@@ -828,6 +1075,11 @@ class WipeSettingsCommand(Command):
     === ==========
     """
 
+    __slots__ = ('index', 'rate', 'pattern', 'width', 'source', 'symmetry', 'softness', 'positionx', 'positiony',
+                 'reverse', 'flipflop')
+    _NAME = b'CTWp'
+    _STRUCT = struct.Struct('>HBBBx HHHHHH??')
+
     def __init__(self, index, rate=None, pattern=None, width=None, source=None, symmetry=None, softness=None,
                  positionx=None, positiony=None, reverse=None, flipflop=None):
         """
@@ -856,42 +1108,60 @@ class WipeSettingsCommand(Command):
         self.reverse = reverse
         self.flipflop = flipflop
 
-    def get_command(self):
+    def _pack_args(self):
         mask = 0
-        if self.rate is not None:
+        rate = self.rate
+        if rate is None:
+            rate = 0
+        else:
             mask |= 1 << 0
-        if self.pattern is not None:
+        pattern = self.pattern
+        if pattern is None:
+            pattern = 0
+        else:
             mask |= 1 << 1
-        if self.width is not None:
+        width = self.width
+        if width is None:
+            width = 0
+        else:
             mask |= 1 << 2
-        if self.source is not None:
+        source = self.source
+        if source is None:
+            source = 0
+        else:
             mask |= 1 << 3
-        if self.symmetry is not None:
+        symmetry = self.symmetry
+        if symmetry is None:
+            symmetry = 0
+        else:
             mask |= 1 << 4
-        if self.softness is not None:
+        softness = self.softness
+        if softness is None:
+            softness = 0
+        else:
             mask |= 1 << 5
-        if self.positionx is not None:
+        x = self.positionx
+        if x is None:
+            x = 0
+        else:
             mask |= 1 << 6
-        if self.positiony is not None:
+        y = self.positiony
+        if y is None:
+            y = 0
+        else:
             mask |= 1 << 7
-        if self.reverse is not None:
+        reverse = self.reverse
+        if reverse is None:
+            reverse = False
+        else:
             mask |= 1 << 8
-        if self.flipflop is not None:
+        flipflop = self.flipflop
+        if flipflop is None:
+            flipflop = False
+        else:
             mask |= 1 << 9
-
-        rate = 0 if self.rate is None else self.rate
-        pattern = 0 if self.pattern is None else self.pattern
-        width = 0 if self.width is None else self.width
-        source = 0 if self.source is None else self.source
-        symmetry = 0 if self.symmetry is None else self.symmetry
-        softness = 0 if self.softness is None else self.softness
-        x = 0 if self.positionx is None else self.positionx
-        y = 0 if self.positiony is None else self.positiony
-        reverse = False if self.reverse is None else self.reverse
-        flipflop = False if self.flipflop is None else self.flipflop
-        data = struct.pack('>HBBBx HHHHHH??', mask, self.index, rate, pattern, width, source, symmetry, softness, x, y,
-                           reverse, flipflop)
-        return self._make_command('CTWp', data)
+        return (mask, self.index, rate, pattern, width, source, symmetry, softness, x, y,
+                reverse, flipflop)
 
 
 class DveSettingsCommand(Command):
@@ -937,6 +1207,11 @@ class DveSettingsCommand(Command):
     === ==========
     """
 
+    __slots__ = ('index', 'rate', 'style', 'fill_source', 'key_source', 'key_enable', 'key_premultiplied', 'key_clip',
+                 'key_gain', 'key_invert', 'reverse', 'flipflop')
+    _NAME = b'CTDv'
+    _STRUCT = struct.Struct('>HBBx BHH ??HH? ?? x')
+
     def __init__(self, index, rate=None, style=None, fill_source=None, key_source=None, key_enable=None,
                  key_premultiplied=None, key_clip=None, key_gain=None, key_invert=None, reverse=None, flipflop=None):
         """
@@ -967,45 +1242,65 @@ class DveSettingsCommand(Command):
         self.reverse = reverse
         self.flipflop = flipflop
 
-    def get_command(self):
+    def _pack_args(self):
         mask = 0
-        if self.rate is not None:
+        rate = self.rate
+        if rate is None:
+            rate = 0
+        else:
             mask |= 1 << 0
-        if self.style is not None:
+        style = self.style
+        if style is None:
+            style = 0
+        else:
             mask |= 1 << 2
-        if self.fill_source is not None:
+        fill_source = self.fill_source
+        if fill_source is None:
+            fill_source = 0
+        else:
             mask |= 1 << 3
-        if self.key_source is not None:
+        key_source = self.key_source
+        if key_source is None:
+            key_source = 0
+        else:
             mask |= 1 << 4
-        if self.key_enable is not None:
+        key_enable = self.key_enable
+        if key_enable is None:
+            key_enable = False
+        else:
             mask |= 1 << 5
-        if self.key_premultiplied is not None:
+        key_premultiplied = self.key_premultiplied
+        if key_premultiplied is None:
+            key_premultiplied = False
+        else:
             mask |= 1 << 6
-        if self.key_clip is not None:
+        key_clip = self.key_clip
+        if key_clip is None:
+            key_clip = 0
+        else:
             mask |= 1 << 7
-        if self.key_gain is not None:
+        key_gain = self.key_gain
+        if key_gain is None:
+            key_gain = 0
+        else:
             mask |= 1 << 8
-        if self.key_invert is not None:
+        key_invert = self.key_invert
+        if key_invert is None:
+            key_invert = False
+        else:
             mask |= 1 << 9
-        if self.reverse is not None:
+        reverse = self.reverse
+        if reverse is None:
+            reverse = False
+        else:
             mask |= 1 << 10
-        if self.flipflop is not None:
+        flipflop = self.flipflop
+        if flipflop is None:
+            flipflop = False
+        else:
             mask |= 1 << 11
-
-        rate = 0 if self.rate is None else self.rate
-        style = 0 if self.style is None else self.style
-        fill_source = 0 if self.fill_source is None else self.fill_source
-        key_source = 0 if self.key_source is None else self.key_source
-        key_enable = False if self.key_enable is None else self.key_enable
-        key_premultiplied = False if self.key_premultiplied is None else self.key_premultiplied
-        key_clip = 0 if self.key_clip is None else self.key_clip
-        key_gain = 0 if self.key_gain is None else self.key_gain
-        key_invert = False if self.key_invert is None else self.key_invert
-        reverse = False if self.reverse is None else self.reverse
-        flipflop = False if self.flipflop is None else self.flipflop
-        data = struct.pack('>HBBx BHH ??HH? ?? x', mask, self.index, rate, style, fill_source, key_source, key_enable,
-                           key_premultiplied, key_clip, key_gain, key_invert, reverse, flipflop)
-        return self._make_command('CTDv', data)
+        return (mask, self.index, rate, style, fill_source, key_source, key_enable,
+                key_premultiplied, key_clip, key_gain, key_invert, reverse, flipflop)
 
 
 class AudioMasterPropertiesCommand(Command):
@@ -1032,6 +1327,10 @@ class AudioMasterPropertiesCommand(Command):
     === ==========
     """
 
+    __slots__ = ('volume', 'afv')
+    _NAME = b'CAMM'
+    _STRUCT = struct.Struct('>B x H 2x ?x')
+
     def __init__(self, volume=None, afv=None):
         """
         :param volume: New volume of the master channel, or None
@@ -1040,18 +1339,20 @@ class AudioMasterPropertiesCommand(Command):
         self.volume = volume
         self.afv = afv
 
-    def get_command(self):
+    def _pack_args(self):
         mask = 0
-        if self.volume is not None:
+        volume = self.volume
+        if volume is None:
+            volume = 0
+        else:
             mask |= 1 << 0
-        if self.afv is not None:
+        afv = self.afv
+        if afv is None:
+            afv = False
+        else:
             mask |= 1 << 2
 
-        afv = False if self.afv is None else self.afv
-        volume = 0 if self.volume is None else self.volume
-
-        data = struct.pack('>B x H 2x ?x', mask, volume, afv)
-        return self._make_command('CAMM', data)
+        return (mask, volume, afv)
 
 
 class AudioMonitorPropertiesCommand(Command):
@@ -1085,6 +1386,10 @@ class AudioMonitorPropertiesCommand(Command):
     === ==========
     """
 
+    __slots__ = ('enabled', 'volume', 'mute', 'solo', 'solo_source', 'dim', 'dim_volume')
+    _NAME = b'CAMm'
+    _STRUCT = struct.Struct('>BB H ?? H ?x H')
+
     def __init__(self, enabled=None, volume=None, mute=None, solo=None, solo_source=None, dim=None, dim_volume=None):
         """
         :param volume: New volume of the master channel, or None
@@ -1098,33 +1403,45 @@ class AudioMonitorPropertiesCommand(Command):
         self.dim = dim
         self.dim_volume = dim_volume
 
-    def get_command(self):
+    def _pack_args(self):
         mask = 0
-        if self.enabled is not None:
+        enabled = self.enabled
+        if enabled is None:
+            enabled = False
+        else:
             mask |= 1 << 0
-        if self.volume is not None:
+        volume = self.volume
+        if volume is None:
+            volume = 0
+        else:
             mask |= 1 << 1
-        if self.mute is not None:
+        mute = self.mute
+        if mute is None:
+            mute = False
+        else:
             mask |= 1 << 2
-        if self.solo is not None:
+        solo = self.solo
+        if solo is None:
+            solo = False
+        else:
             mask |= 1 << 3
-        if self.solo_source is not None:
+        solo_source = self.solo_source
+        if solo_source is None:
+            solo_source = 0
+        else:
             mask |= 1 << 4
-        if self.dim is not None:
+        dim = self.dim
+        if dim is None:
+            dim = False
+        else:
             mask |= 1 << 5
-        if self.dim_volume is not None:
+        dim_volume = self.dim_volume
+        if dim_volume is None:
+            dim_volume = 0
+        else:
             mask |= 1 << 6
 
-        enabled = False if self.enabled is None else self.enabled
-        volume = 0 if self.volume is None else self.volume
-        mute = False if self.mute is None else self.mute
-        solo = False if self.solo is None else self.solo
-        solo_source = 0 if self.solo_source is None else self.solo_source
-        dim = False if self.dim is None else self.dim
-        dim_volume = 0 if self.dim_volume is None else self.dim_volume
-
-        data = struct.pack('>BB H ?? H ?x H', mask, enabled, volume, mute, solo, solo_source, dim, dim_volume)
-        return self._make_command('CAMm', data)
+        return (mask, enabled, volume, mute, solo, solo_source, dim, dim_volume)
 
 
 class AudioInputCommand(Command):
@@ -1160,6 +1477,10 @@ class AudioInputCommand(Command):
 
     """
 
+    __slots__ = ('source', 'balance', 'volume', 'on', 'afv')
+    _NAME = b'CAMI'
+    _STRUCT = struct.Struct('>B x H B x H h x x')
+
     def __init__(self, source, balance=None, volume=None, on=None, afv=None):
         """
         :param index: 0-indexed M/E number to control the preview bus of
@@ -1170,26 +1491,27 @@ class AudioInputCommand(Command):
         self.on = on
         self.afv = afv
 
-    def get_command(self):
+    def _pack_args(self):
         mask = 0
-        if self.on is not None or self.afv is not None:
-            mask |= 1 << 0
-        if self.volume is not None:
-            mask |= 1 << 1
-        if self.balance is not None:
-            mask |= 1 << 2
-
         state = 0
         if self.on is not None:
+            mask |= 1 << 0
             state = int(bool(self.on))
         elif self.afv is not None:
+            mask |= 1 << 0
             state = int(bool(self.afv)) * 2
+        volume = self.volume
+        if volume is None:
+            volume = 0
+        else:
+            mask |= 1 << 1
+        balance = self.balance
+        if balance is None:
+            balance = 0
+        else:
+            mask |= 1 << 2
 
-        balance = 0 if self.balance is None else self.balance
-        volume = 0 if self.volume is None else self.volume
-
-        data = struct.pack('>B x H B x H h x x', mask, self.source, state, volume, balance)
-        return self._make_command('CAMI', data)
+        return (mask, self.source, state, volume, balance)
 
 
 class FairlightMasterPropertiesCommand(Command):
@@ -1224,6 +1546,10 @@ class FairlightMasterPropertiesCommand(Command):
 
     """
 
+    __slots__ = ('eq_gain', 'dynamics_gain', 'volume', 'afv', 'eq_enable')
+    _NAME = b'CFMP'
+    _STRUCT = struct.Struct('>B 5x h 2x Hi?? 2x')
+
     def __init__(self, eq_gain=None, dynamics_gain=None, volume=None, afv=None, eq_enable=None):
         """
         :param index: 0-indexed M/E number to control the preview bus of
@@ -1235,27 +1561,35 @@ class FairlightMasterPropertiesCommand(Command):
         self.afv = afv
         self.eq_enable = eq_enable
 
-    def get_command(self):
+    def _pack_args(self):
         mask = 0
-        if self.eq_enable is not None:
+        eq_enable = self.eq_enable
+        if eq_enable is None:
+            eq_enable = False
+        else:
             mask |= 1 << 0
-        if self.eq_gain is not None:
+        eq_gain = self.eq_gain
+        if eq_gain is None:
+            eq_gain = 0
+        else:
             mask |= 1 << 1
-        if self.dynamics_gain is not None:
+        dynamics_gain = self.dynamics_gain
+        if dynamics_gain is None:
+            dynamics_gain = 0
+        else:
             mask |= 1 << 2
-        if self.volume is not None:
+        volume = self.volume
+        if volume is None:
+            volume = 0
+        else:
             mask |= 1 << 3
-        if self.afv is not None:
+        afv = self.afv
+        if afv is None:
+            afv = False
+        else:
             mask |= 1 << 4
 
-        eq_enable = False if self.eq_enable is None else self.eq_enable
-        eq_gain = 0 if self.eq_gain is None else self.eq_gain
-        dynamics_gain = 0 if self.dynamics_gain is None else self.dynamics_gain
-        volume = 0 if self.volume is None else self.volume
-        afv = False if self.afv is None else self.afv
-
-        data = struct.pack('>B 5x h 2x Hi?? 2x', mask, eq_gain, dynamics_gain, volume, afv, eq_enable)
-        return self._make_command('CFMP', data)
+        return (mask, eq_gain, dynamics_gain, volume, afv, eq_enable)
 
 
 class FairlightStripPropertiesCommand(Command):
@@ -1295,6 +1629,13 @@ class FairlightStripPropertiesCommand(Command):
 
     """
 
+    __slots__ = ('source', 'channel', 'delay', 'gain', 'eq_gain', 'eq_enable', 'dynamics_gain', 'balance', 'volume',
+                 'state')
+    _NAME = b'CFSP'
+    _STRUCT = struct.Struct('>H H4x6sBb B 3x i ? 5x h 2x Hh 2x iB 3x')
+    # The 6s field is always filled with 0xff
+    _PAD = b'\xff' * 6
+
     def __init__(self, source, channel, delay=None, gain=None, eq_gain=None, eq_enable=None, dynamics_gain=None,
                  balance=None, volume=None, state=None):
         """
@@ -1311,42 +1652,55 @@ class FairlightStripPropertiesCommand(Command):
         self.volume = volume
         self.state = state
 
-    def get_command(self):
+    def _pack_args(self):
         mask = 0
-        if self.delay is not None:
+        delay = self.delay
+        if delay is None:
+            delay = 0
+        else:
             mask |= 1 << 0
-        if self.gain is not None:
+        gain = self.gain
+        if gain is None:
+            gain = 0
+        else:
             mask |= 1 << 1
-        if self.eq_enable is not None:
+        eq_enable = self.eq_enable
+        if eq_enable is None:
+            eq_enable = False
+        else:
             mask |= 1 << 3
-        if self.eq_gain is not None:
+        eq_gain = self.eq_gain
+        if eq_gain is None:
+            eq_gain = 0
+        else:
             mask |= 1 << 4
-        if self.dynamics_gain is not None:
+        dynamics_gain = self.dynamics_gain
+        if dynamics_gain is None:
+            dynamics_gain = 0
+        else:
             mask |= 1 << 5
-        if self.balance is not None:
+        balance = self.balance
+        if balance is None:
+            balance = 0
+        else:
             mask |= 1 << 6
-        if self.volume is not None:
+        volume = self.volume
+        if volume is None:
+            volume = 0
+        else:
             mask |= 1 << 7
-        if self.state is not None:
+        state = self.state
+        if state is None:
+            state = 0
+        else:
             mask |= 1 << 8
 
-        delay = 0 if self.delay is None else self.delay
-        gain = 0 if self.gain is None else self.gain
-        eq_enable = False if self.eq_enable is None else self.eq_enable
-        eq_gain = 0 if self.eq_gain is None else self.eq_gain
-        dynamics_gain = 0 if self.dynamics_gain is None else self.dynamics_gain
-        balance = 0 if self.balance is None else self.balance
-        volume = 0 if self.volume is None else self.volume
-        state = 0 if self.state is None else self.state
-
         split = 0xff if self.channel > -1 else 0x01
         self.channel = 0x00 if self.channel == -1 else self.channel
-        pad = b'\xff\xff\xff\xff\xff\xff\xff'
-        data = struct.pack('>H H4x6sBb B 3x i ? 5x h 2x Hh 2x iB 3x', mask, self.source, pad, split, self.channel,
-                           delay,
-                           gain, eq_enable, eq_gain,
-                           dynamics_gain, balance, volume, state)
-        return self._make_command('CFSP', data)
+        return (mask, self.source, self._PAD, split, self.channel,
+                delay,
+                gain, eq_enable, eq_gain,
+                dynamics_gain, balance, volume, state)
 
 
 class KeyOnAirCommand(Command):
@@ -1364,6 +1718,11 @@ class KeyOnAirCommand(Command):
 
     """
 
+    __slots__ = ('index', 'keyer', 'enabled')
+    _NAME = b'CKOn'
+    _STRUCT = struct.Struct('>BB?x')
+    _CACHE_PACKETS = True
+
     def __init__(self, index, keyer, enabled):
         """
         :param index: 0-indexed DSK number to trigger
@@ -1374,9 +1733,8 @@ class KeyOnAirCommand(Command):
         self.keyer = keyer
         self.enabled = enabled
 
-    def get_command(self):
-        data = struct.pack('>BB?x', self.index, self.keyer, self.enabled)
-        return self._make_command('CKOn', data)
+    def _pack_args(self):
+        return (self.index, self.keyer, self.enabled)
 
 
 class KeyFillCommand(Command):
@@ -1393,6 +1751,11 @@ class KeyFillCommand(Command):
 
     """
 
+    __slots__ = ('index', 'keyer', 'source')
+    _NAME = b'CKeF'
+    _STRUCT = struct.Struct('>BBH')
+    _CACHE_PACKETS = True
+
     def __init__(self, index, keyer, source):
         """
         :param index: 0-indexed DSK number to trigger
@@ -1403,9 +1766,8 @@ class KeyFillCommand(Command):
         self.keyer = keyer
         self.source = source
 
-    def get_command(self):
-        data = struct.pack('>BBH', self.index, self.keyer, self.source)
-        return self._make_command('CKeF', data)
+    def _pack_args(self):
+        return (self.index, self.keyer, self.source)
 
 
 class KeyCutCommand(Command):
@@ -1422,6 +1784,11 @@ class KeyCutCommand(Command):
 
     """
 
+    __slots__ = ('index', 'keyer', 'source')
+    _NAME = b'CKeC'
+    _STRUCT = struct.Struct('>BBH')
+    _CACHE_PACKETS = True
+
     def __init__(self, index, keyer, source):
         """
         :param index: 0-indexed DSK number to trigger
@@ -1432,9 +1799,8 @@ class KeyCutCommand(Command):
         self.keyer = keyer
         self.source = source
 
-    def get_command(self):
-        data = struct.pack('>BBH', self.index, self.keyer, self.source)
-        return self._make_command('CKeC', data)
+    def _pack_args(self):
+        return (self.index, self.keyer, self.source)
 
 
 class KeyTypeCommand(Command):
@@ -1461,6 +1827,10 @@ class KeyTypeCommand(Command):
 
     """
 
+    __slots__ = ('index', 'keyer', 'type', 'fly_enabled')
+    _NAME = b'CKTp'
+    _STRUCT = struct.Struct('>BBB B? 3x')
+
     LUMA = 0
     CHROMA = 1
     PATTERN = 2
@@ -1477,18 +1847,20 @@ class KeyTypeCommand(Command):
         self.type = type
         self.fly_enabled = fly_enabled
 
-    def get_command(self):
+    def _pack_args(self):
         mask = 0
-        if self.type is not None:
+        key_type = self.type
+        if key_type is None:
+            key_type = 0
+        else:
             mask |= 1 << 0
-        if self.fly_enabled is not None:
+        fly_enabled = self.fly_enabled
+        if fly_enabled is None:
+            fly_enabled = 0
+        else:
             mask |= 1 << 1
 
-        key_type = 0 if self.type is None else self.type
-        fly_enabled = 0 if self.fly_enabled is None else self.fly_enabled
-
-        data = struct.pack('>BBB B? 3x', mask, self.index, self.keyer, key_type, fly_enabled)
-        return self._make_command('CKTp', data)
+        return (mask, self.index, self.keyer, key_type, fly_enabled)
 
 
 class KeyPropertiesDveCommand(Command):
@@ -1566,6 +1938,13 @@ class KeyPropertiesDveCommand(Command):
 
     """
 
+    __slots__ = ('index', 'keyer', 'size_x', 'size_y', 'pos_x', 'pos_y', 'rotation', 'border_enabled', 'shadow_enabled',
+                 'border_bevel_enabled', 'outer_width', 'inner_width', 'outer_softness', 'inner_softness',
+                 'bevel_softness', 'bevel_position', 'border_opacity', 'border_hue', 'border_saturation', 'border_luma',
+                 'angle', 'altitude', 'mask_enabled', 'mask_top', 'mask_bottom', 'mask_left', 'mask_right', 'rate')
+    _NAME = b'CKDV'
+    _STRUCT = struct.Struct('>I BBxx 5i ??Bx HH5Bx 4HB?hhhhBxxx')
+
     def __init__(self, index, keyer, size_x=None, size_y=None, pos_x=None, pos_y=None, rotation=None,
                  border_enabled=None, shadow_enabled=None, border_bevel_enabled=None, outer_width=None,
                  inner_width=None, outer_softness=None, inner_softness=None, bevel_softness=None, bevel_position=None,
@@ -1605,129 +1984,179 @@ class KeyPropertiesDveCommand(Command):
         self.rate = rate
 
     def set_border_color_rgb(self, red, green, blue):
-        h, l, s = colorsys.rgb_to_hls(red, green, blue)
+        h, l, s = _rgb_to_hls(red, green, blue)
         self.border_hue = int(h * 3590)
         self.border_saturation = int(s * 1000)
         self.border_luma = int(l * 1000)
 
-    def get_command(self):
+    def _pack_args(self):
+        index = self.index or 0
+        keyer = self.keyer or 0
         mask = 0
-        if self.size_x is not None:
+        size_x = self.size_x
+        if size_x is None:
+            size_x = 0
+        else:
             mask |= 1 << 0
-        if self.size_y is not None:
+        size_y = self.size_y
+        if size_y is None:
+            size_y = 0
+        else:
             mask |= 1 << 1
-        if self.pos_x is not None:
+        pos_x = self.pos_x
+        if pos_x is None:
+            pos_x = 0
+        else:
             mask |= 1 << 2
-        if self.pos_y is not None:
+        pos_y = self.pos_y
+        if pos_y is None:
+            pos_y = 0
+        else:
             mask |= 1 << 3
-        if self.rotation is not None:
+        rotation = self.rotation
+        if rotation is None:
+            rotation = 0
+        else:
             mask |= 1 << 4
-        if self.border_enabled is not None:
+        border_enabled = self.border_enabled
+        if border_enabled is None:
+            border_enabled = 0
+        else:
             mask |= 1 << 5
-        if self.shadow_enabled is not None:
+        shadow_enabled = self.shadow_enabled
+        if shadow_enabled is None:
+            shadow_enabled = 0
+        else:
             mask |= 1 << 6
-        if self.border_bevel_enabled is not None:
+        border_bevel_enabled = self.border_bevel_enabled
+        if border_bevel_enabled is None:
+            border_bevel_enabled = 0
+        else:
             mask |= 1 << 7
-        if self.outer_width is not None:
+        outer_width = self.outer_width
+        if outer_width is None:
+            outer_width = 0
+        else:
             mask |= 1 << 8
-        if self.inner_width is not None:
+        inner_width = self.inner_width
+        if inner_width is None:
+            inner_width = 0
+        else:
             mask |= 1 << 9
-        if self.outer_softness is not None:
+        outer_softness = self.outer_softness
+        if outer_softness is None:
+            outer_softness = 0
+        else:
             mask |= 1 << 10
-        if self.inner_softness is not None:
+        inner_softness = self.inner_softness
+        if inner_softness is None:
+            inner_softness = 0
+        else:
             mask |= 1 << 11
-        if self.bevel_softness is not None:
+        bevel_softness = self.bevel_softness
+        if bevel_softness is None:
+            bevel_softness = 0
+        else:
             mask |= 1 << 12
-        if self.bevel_position is not None:
+        bevel_position = self.bevel_position
+        if bevel_position is None:
+            bevel_position = 0
+        else:
             mask |= 1 << 13
-        if self.border_opacity is not None:
+        border_opacity = self.border_opacity
+        if border_opacity is None:
+            border_opacity = 0
+        else:
             mask |= 1 << 14
-        if self.border_hue is not None:
+        border_hue = self.border_hue
+        if border_hue is None:
+            border_hue = 0
+        else:
             mask |= 1 << 15
-        if self.border_saturation is not None:
+        border_saturation = self.border_saturation
+        if border_saturation is None:
+            border_saturation = 0
+        else:
             mask |= 1 << 16
-        if self.border_luma is not None:
+        border_luma = self.border_luma
+        if border_luma is None:
+            border_luma = 0
+        else:
             mask |= 1 << 17
-        if self.angle is not None:
+        angle = self.angle
+        if angle is None:
+            angle = 0
+        else:
             mask |= 1 << 18
-        if self.altitude is not None:
+        altitude = self.altitude
+        if altitude is None:
+            altitude = 0
+        else:
             mask |= 1 << 19
-        if self.mask_enabled is not None:
+        mask_enabled = self.mask_enabled
+        if mask_enabled is None:
+            mask_enabled = 0
+        else:
             mask |= 1 << 20
-        if self.mask_top is not None:
+        mask_top = self.mask_top
+        if mask_top is None:
+            mask_top = 0
+        else:
             mask |= 1 << 21
-        if self.mask_bottom is not None:
+        mask_bottom = self.mask_bottom
+        if mask_bottom is None:
+            mask_bottom = 0
+        else:
             mask |= 1 << 22
-        if self.mask_left is not None:
+        mask_left = self.mask_left
+        if mask_left is None:
+            mask_left = 0
+        else:
             mask |= 1 << 23
-        if self.mask_right is not None:
+        mask_right = self.mask_right
+        if mask_right is None:
+            mask_right = 0
+        else:
             mask |= 1 << 24
-        if self.rate is not None:
+        rate = self.rate
+        if rate is None:
+            rate = 0
+        else:
             mask |= 1 << 25
 
-        index = 0 if self.index is None else self.index
-        keyer = 0 if self.keyer is None else self.keyer
-        size_x = 0 if self.size_x is None else self.size_x
-        size_y = 0 if self.size_y is None else self.size_y
-        pos_x = 0 if self.pos_x is None else self.pos_x
-        pos_y = 0 if self.pos_y is None else self.pos_y
-        rotation = 0 if self.rotation is None else self.rotation
-        border_enabled = 0 if self.border_enabled is None else self.border_enabled
-        shadow_enabled = 0 if self.shadow_enabled is None else self.shadow_enabled
-        border_bevel_enabled = 0 if self.border_bevel_enabled is None else self.border_bevel_enabled
-        outer_width = 0 if self.outer_width is None else self.outer_width
-        inner_width = 0 if self.inner_width is None else self.inner_width
-        outer_softness = 0 if self.outer_softness is None else self.outer_softness
-        inner_softness = 0 if self.inner_softness is None else self.inner_softness
-        bevel_softness = 0 if self.bevel_softness is None else self.bevel_softness
-        bevel_position = 0 if self.bevel_position is None else self.bevel_position
-        border_opacity = 0 if self.border_opacity is None else self.border_opacity
-        border_hue = 0 if self.border_hue is None else self.border_hue
-        border_saturation = 0 if self.border_saturation is None else self.border_saturation
-        border_luma = 0 if self.border_luma is None else self.border_luma
-        angle = 0 if self.angle is None else self.angle
-        altitude = 0 if self.altitude is None else self.altitude
-        mask_enabled = 0 if self.mask_enabled is None else self.mask_enabled
-        mask_top = 0 if self.mask_top is None else self.mask_top
-        mask_bottom = 0 if self.mask_bottom is None else self.mask_bottom
-        mask_left = 0 if self.mask_left is None else self.mask_left
-        mask_right = 0 if self.mask_right is None else self.mask_right
-        rate = 0 if self.rate is None else self.rate
-
-        data = struct.pack('>I BBxx 5i ??Bx HH5Bx 4HB?hhhhBxxx', mask, index,
-                           keyer,
-
-                           size_x,
-                           size_y,
-                           pos_x,
-                           pos_y,
-                           rotation,
-
-                           border_enabled,
-                           shadow_enabled,
-                           border_bevel_enabled,
-
-                           outer_width,
-                           inner_width,
-                           outer_softness,
-                           inner_softness,
-                           bevel_softness,
-                           bevel_position,
-                           border_opacity,
-
-                           border_hue,
-                           border_saturation,
-                           border_luma,
-                           angle,
-
-                           altitude,
-                           mask_enabled,
-                           mask_top,
-                           mask_bottom,
-                           mask_left,
-                           mask_right,
-                           rate)
-        return self._make_command('CKDV', data)
+        return (mask, index,
+                keyer,
+
+                size_x,
+                size_y,
+                pos_x,
+                pos_y,
+                rotation,
+
+                border_enabled,
+                shadow_enabled,
+                border_bevel_enabled,
+
+                outer_width,
+                inner_width,
+                outer_softness,
+                inner_softness,
+                bevel_softness,
+                bevel_position,
+                border_opacity,
+
+                border_hue,
+                border_saturation,
+                border_luma,
+                angle,
+
+                altitude,
+                mask_enabled,
+                mask_top,
+                mask_bottom,
+                mask_left,
+                mask_right,
+                rate)
 
 
 class KeyPropertiesAdvancedChromaColorpickerCommand(Command):
@@ -1767,6 +2196,10 @@ class KeyPropertiesAdvancedChromaColorpickerCommand(Command):
 
     """
 
+    __slots__ = ('index', 'keyer', 'cursor', 'preview', 'x', 'y', 'size', 'Y', 'Cb', 'Cr')
+    _NAME = b'CACC'
+    _STRUCT = struct.Struct('>BBB? ?x hhH Hhh xx')
+
     def __init__(self, index, keyer, cursor=None, preview=None, x=None, y=None, size=None, Y=None, Cb=None, Cr=None):
         """
         :param index: 0-indexed M/E number to control the preview bus of
@@ -1782,40 +2215,53 @@ class KeyPropertiesAdvancedChromaColorpickerCommand(Command):
         self.Cb = Cb
         self.Cr = Cr
 
-    def get_command(self):
+    def _pack_args(self):
+        index = self.index or 0
+        keyer = self.keyer or 0
         mask = 0
-        if self.cursor is not None:
+        cursor = self.cursor
+        if cursor is None:
+            cursor = False
+        else:
             mask |= 1 << 0
-        if self.preview is not None:
+        preview = self.preview
+        if preview is None:
+            preview = False
+        else:
             mask |= 1 << 1
-        if self.x is not None:
+        x = self.x
+        if x is None:
+            x = 0
+        else:
             mask |= 1 << 2
-        if self.y is not None:
+        y = self.y
+        if y is None:
+            y = 0
+        else:
             mask |= 1 << 3
-        if self.size is not None:
+        size = self.size
+        if size is None:
+            size = 0
+        else:
             mask |= 1 << 4
-        if self.Y is not None:
+        Y = self.Y
+        if Y is None:
+            Y = 0
+        else:
             mask |= 1 << 5
-        if self.Cb is not None:
+        Cb = self.Cb
+        if Cb is None:
+            Cb = 0
+        else:
             mask |= 1 << 6
-        if self.Cr is not None:
+        Cr = self.Cr
+        if Cr is None:
+            Cr = 0
+        else:
             mask |= 1 << 7
 
-        index = 0 if self.index is None else self.index
-        keyer = 0 if self.keyer is None else self.keyer
-        cursor = False if self.cursor is None else self.cursor
-        preview = False if self.preview is None else self.preview
-        x = 0 if self.x is None else self.x
-        y = 0 if self.y is None else self.y
-        size = 0 if self.size is None else self.size
-        Y = 0 if self.Y is None else self.Y
-        Cb = 0 if self.Cb is None else self.Cb
-        Cr = 0 if self.Cr is None else self.Cr
-
-        data = struct.pack('>BBB? ?x hhH Hhh xx', mask, index, keyer,
-                           cursor, preview, x, y, size, Y, Cb, Cr)
-
-        return self._make_command('CACC', data)
+        return (mask, index, keyer,
+                cursor, preview, x, y, size, Y, Cb, Cr)
 
 
 class KeyPropertiesAdvancedChromaCommand(Command):
@@ -1860,6 +2306,11 @@ class KeyPropertiesAdvancedChromaCommand(Command):
 
     """
 
+    __slots__ = ('index', 'keyer', 'foreground', 'background', 'key_edge', 'spill', 'flare', 'brightness', 'contrast',
+                 'saturation', 'red', 'green', 'blue')
+    _NAME = b'CACK'
+    _STRUCT = struct.Struct('>HBB HHH HH hhHhhh xx')
+
     def __init__(self, index, keyer, foreground=None, background=None, key_edge=None, spill=None, flare=None,
                  brightness=None, contrast=None, saturation=None, red=None, green=None, blue=None):
         """
@@ -1879,47 +2330,66 @@ class KeyPropertiesAdvancedChromaCommand(Command):
         self.green = green
         self.blue = blue
 
-    def get_command(self):
+    def _pack_args(self):
         mask = 0
-        if self.foreground is not None:
+        foreground = self.foreground
+        if foreground is None:
+            foreground = 0
+        else:
             mask |= 1 << 0
-        if self.background is not None:
+        background = self.background
+        if background is None:
+            background = 0
+        else:
             mask |= 1 << 1
-        if self.key_edge is not None:
+        key_edge = self.key_edge
+        if key_edge is None:
+            key_edge = 0
+        else:
             mask |= 1 << 2
-        if self.spill is not None:
+        spill = self.spill
+        if spill is None:
+            spill = 0
+        else:
             mask |= 1 << 3
-        if self.flare is not None:
+        flare = self.flare
+        if flare is None:
+            flare = 0
+        else:
             mask |= 1 << 4
-        if self.brightness is not None:
+        brightness = self.brightness
+        if brightness is None:
+            brightness = 0
+        else:
             mask |= 1 << 5
-        if self.contrast is not None:
+        contrast = self.contrast
+        if contrast is None:
+            contrast = 0
+        else:
             mask |= 1 << 6
-        if self.saturation is not None:
+        saturation = self.saturation
+        if saturation is None:
+            saturation = 0
+        else:
             mask |= 1 << 7
-        if self.red is not None:
+        red = self.red
+        if red is None:
+            red = 0
+        else:
             mask |= 1 << 8
-        if self.green is not None:
+        green = self.green
+        if green is None:
+            green = 0
+        else:
             mask |= 1 << 9
-        if self.blue is not None:
+        blue = self.blue
+        if blue is None:
+            blue = 0
+        else:
             mask |= 1 << 10
 
-        foreground = 0 if self.foreground is None else self.foreground
-        background = 0 if self.background is None else self.background
-        key_edge = 0 if self.key_edge is None else self.key_edge
-        spill = 0 if self.spill is None else self.spill
-        flare = 0 if self.flare is None else self.flare
-        brightness = 0 if self.brightness is None else self.brightness
-        contrast = 0 if self.contrast is None else self.contrast
-        saturation = 0 if self.saturation is None else self.saturation
-        red = 0 if self.red is None else self.red
-        green = 0 if self.green is None else self.green
-        blue = 0 if self.blue is None else self.blue
-
-        data = struct.pack('>HBB HHH HH hhHhhh xx', mask, self.index, self.keyer, foreground, background, key_edge, spill,
-                           flare, brightness, contrast, saturation, red, green, blue)
-
-        return self._make_command('CACK', data)
+        return (mask, self.index, self.keyer, foreground, background, key_edge, spill,
+                flare, brightness, contrast, saturation, red, green, blue)
 
 
 class KeyPropertiesLumaCommand(Command):
@@ -1950,6 +2420,10 @@ class KeyPropertiesLumaCommand(Command):
 
     """
 
+    __slots__ = ('index', 'keyer', 'premultiplied', 'clip', 'gain', 'invert_key')
+    _NAME = b'CKLm'
+    _STRUCT = struct.Struct('>BBB?HH?3x')
+
     def __init__(self, index, keyer, premultiplied=None, clip=None, gain=None, invert_key=None):
         """
         :param index: 0-indexed DSK number to trigger
@@ -1963,24 +2437,30 @@ class KeyPropertiesLumaCommand(Command):
         self.gain = gain
         self.invert_key = invert_key
 
-    def get_command(self):
+    def _pack_args(self):
         mask = 0
-        if self.premultiplied is not None:
+        premultiplied = self.premultiplied
+        if premultiplied is None:
+            premultiplied = 0
+        else:
             mask |= 1 << 0
-        if self.clip is not None:
+        clip = self.clip
+        if clip is None:
+            clip = 0
+        else:
             mask |= 1 << 1
-        if self.gain is not None:
+        gain = self.gain
+        if gain is None:
+            gain = 0
+        else:
             mask |= 1 << 2
-        if self.invert_key is not None:
+        invert_key = self.invert_key
+        if invert_key is None:
+            invert_key = 0
+        else:
             mask |= 1 << 3
 
-        premultiplied = 0 if self.premultiplied is None else self.premultiplied
-        clip = 0 if self.clip is None else self.clip
-        gain = 0 if self.gain is None else self.gain
-        invert_key = 0 if self.invert_key is None else self.invert_key
-
-        data = struct.pack('>BBB?HH?3x', mask, self.index, self.keyer, premultiplied, clip, gain, invert_key)
-        return self._make_command('CKLm', data)
+        return (mask, self.index, self.keyer, premultiplied, clip, gain, invert_key)
 
 
 class KeyerKeyframeSetCommand(Command):
@@ -1998,6 +2478,10 @@ class KeyerKeyframeSetCommand(Command):
 
     """
 
+    __slots__ = ('index', 'keyer', '_keyframe', '_keyframe_index')
+    _NAME = b'SFKF'
+    _STRUCT = struct.Struct('>BBBx')
+
     def __init__(self, index, keyer, keyframe):
         """
         :param index: M/E index
@@ -2008,10 +2492,18 @@ class KeyerKeyframeSetCommand(Command):
         self.keyer = keyer
         self.keyframe = keyframe
 
-    def get_command(self):
-        keyframe = 1 if self.keyframe == 'A' else 2
-        data = struct.pack('>BBBx', self.index, self.keyer, keyframe)
-        return self._make_command('SFKF', data)
+    @property
+    def keyframe(self):
+        return self._keyframe
+
+    @keyframe.setter
+    def keyframe(self, value):
+        # Translated to the wire value once here so retransmits skip the string compare
+        self._keyframe = value
+        self._keyframe_index = 1 if value == 'A' else 2
+
+    def _pack_args(self):
+        return (self.index, self.keyer, self._keyframe_index)
 
 
 class KeyerKeyframeRunCommand(Command):
@@ -2032,6 +2524,16 @@ class KeyerKeyframeRunCommand(Command):
 
     """
 
+    __slots__ = ('index', 'keyer', 'set_infinite', '_run_to', '_run_to_index')
+    _NAME = b'RFlK'
+    _STRUCT = struct.Struct('>BBBxBB2x')
+    _RUN_TO = {
+        'A': 1,
+        'B': 2,
+        'Full': 3,
+        'Infinite': 4,
+    }
+
     def __init__(self, index, keyer, run_to=None, set_infinite=None):
         """
         :param index: M/E index
@@ -2043,22 +2545,27 @@ class KeyerKeyframeRunCommand(Command):
         self.run_to = run_to
         self.set_infinite = set_infinite
 
-    def get_command(self):
-        run_to_lut = {
-            'A': 1,
-            'B': 2,
-            'Full': 3,
-            'Infinite': 4,
-        }
-        run_to = run_to_lut[self.run_to]
-        set_infinite = self.set_infinite or 0
+    @property
+    def run_to(self):
+        return self._run_to
 
+    @run_to.setter
+    def run_to(self, value):
+        self._run_to = value
+        self._run_to_index = self._RUN_TO.get(value)
+
+    def _pack_args(self):
+        run_to = self._run_to_index
+        if run_to is None:
+            raise KeyError(self._run_to)
         mask = 0
-        if self.set_infinite is not None:
+        set_infinite = self.set_infinite
+        if set_infinite is None:
+            set_infinite = 0
+        else:
             mask |= 1 << 1
 
-        data = struct.pack('>BBBxBB2x', mask, self.index, self.keyer, run_to, set_infinite)
-        return self._make_command('RFlK', data)
+        return (mask, self.index, self.keyer, run_to, set_infinite)
 
 
 class RecorderStatusCommand(Command):
@@ -2074,15 +2581,18 @@ class RecorderStatusCommand(Command):
 
     """
 
+    __slots__ = ('recording',)
+    _NAME = b'RcTM'
+    _STRUCT = struct.Struct('>?3x')
+
     def __init__(self, recording):
         """
         :param recording: Wether the hardware should be recording
         """
         self.recording = recording
 
-    def get_command(self):
-        data = struct.pack('>?3x', self.recording)
-        return self._make_command('RcTM', data)
+    def _pack_args(self):
+        return (self.recording,)
 
 
 class RecordingSettingsSetCommand(Command):
@@ -2101,6 +2611,10 @@ class RecordingSettingsSetCommand(Command):
 
     """
 
+    __slots__ = ('filename', 'disk1', 'disk2', 'record_in_camera')
+    _NAME = b'CRMS'
+    _STRUCT = struct.Struct('>B 128s xxx II ?xxx')
+
     def __init__(self, filename=None, disk1=None, disk2=None, record_in_camera=None):
         """
         :param filename: Filename for recording, or None
@@ -2113,22 +2627,25 @@ class RecordingSettingsSetCommand(Command):
         self.disk2 = disk2
         self.record_in_camera = record_in_camera
 
-    def get_command(self):
+    def _pack_args(self):
         mask = 0
-        if self.filename is not None:
+        filename = self.filename
+        if filename is None:
+            filename = b''
+        else:
             mask |= 1 << 0
+            filename = filename.encode()
         if self.disk1 is not None:
             mask |= 1 << 1
         if self.disk2 is not None:
             mask |= 1 << 2
-        if self.record_in_camera is not None:
+        ric = self.record_in_camera
+        if ric is None:
+            ric = False
+        else:
             mask |= 1 << 3
 
-        filename = self.filename.encode() if self.filename is not None else b''
-        ric = self.record_in_camera if self.record_in_camera is not None else False
-
-        data = struct.pack('>B 128s xxx II ?xxx', mask, filename, self.disk1 or 0, self.disk2 or 0, ric)
-        return self._make_command('CRMS', data)
+        return (mask, filename, self.disk1 or 0, self.disk2 or 0, ric)
 
 
 class StreamingServiceSetCommand(Command):
@@ -2158,6 +2675,10 @@ class StreamingServiceSetCommand(Command):
 
     """
 
+    __slots__ = ('_name', '_name_encoded', '_url', '_url_encoded', '_key', '_key_encoded', 'bitrate_min', 'bitrate_max')
+    _NAME = b'CRSS'
+    _STRUCT = struct.Struct('>B 64s 512s 512s 3x II')
+
     def __init__(self, name=None, url=None, key=None, bitrate_min=None, bitrate_max=None):
         """
         :param name: New streaming service name, or None
@@ -2172,28 +2693,68 @@ class StreamingServiceSetCommand(Command):
         self.bitrate_min = bitrate_min
         self.bitrate_max = bitrate_max
 
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        # The strings are encoded once on assignment since the same settings get re-sent
+        self._name = value
+        self._name_encoded = None if value is None else value.encode()
+
+    @property
+    def url(self):
+        return self._url
+
+    @url.setter
+    def url(self, value):
+        self._url = value
+        self._url_encoded = None if value is None else value.encode()
+
+    @property
+    def key(self):
+        return self._key
+
+    @key.setter
+    def key(self, value):
+        self._key = value
+        self._key_encoded = None if value is None else value.encode()
+
     def get_command(self):
+        try:
+            args = self._pack_args()
+        except ValueError as e:
+            # get_command has always returned this error instead of raising it
+            return e
+        return self._emit(*args)
+
+    def _pack_args(self):
         if self.bitrate_min is None and self.bitrate_max is not None:
-            return ValueError("Both min and max bitrate required")
+            raise ValueError("Both min and max bitrate required")
         if self.bitrate_max is None and self.bitrate_min is not None:
-            return ValueError("Both min and max bitrate required")
+            raise ValueError("Both min and max bitrate required")
         mask = 0
-        if self.name is not None:
+        name = self._name_encoded
+        if name is None:
+            name = b''
+        else:
             mask |= 1 << 0
-        if self.url is not None:
+        url = self._url_encoded
+        if url is None:
+            url = b''
+        else:
             mask |= 1 << 1
-        if self.key is not None:
+        key = self._key_encoded
+        if key is None:
+            key = b''
+        else:
             mask |= 1 << 2
         if self.bitrate_min is not None:
             mask |= 1 << 3
 
-        name = self.name.encode() if self.name is not None else b''
-        url = self.url.encode() if self.url is not None else b''
-        key = self.key.encode() if self.key is not None else b''
-
-        data = struct.pack('>B 64s 512s 512s 3x II', mask, name, url, key,
-                           self.bitrate_min or 0, self.bitrate_max or 0)
-        return self._make_command('CRSS', data)
+        return (mask, name, url, key,
+                self.bitrate_min or 0, self.bitrate_max or 0)
 
 
 class StreamingStatusSetCommand(Command):
@@ -2209,15 +2770,18 @@ class StreamingStatusSetCommand(Command):
 
     """
 
+    __slots__ = ('streaming',)
+    _NAME = b'StrR'
+    _STRUCT = struct.Struct('>?xxx')
+
     def __init__(self, streaming):
         """
         :param streaming: True to start streaming, False to stop streaming
         """
         self.streaming = streaming
 
-    def get_command(self):
-        data = struct.pack('>?xxx', self.streaming)
-        return self._make_command('StrR', data)
+    def _pack_args(self):
+        return (self.streaming,)
 
 
 class MultiviewPropertiesCommand(Command):
@@ -2238,6 +2802,10 @@ class MultiviewPropertiesCommand(Command):
 
     """
 
+    __slots__ = ('index', 'layout', 'swap')
+    _NAME = b'CMvP'
+    _STRUCT = struct.Struct('>BBB?')
+
     def __init__(self, index, layout=None, swap=None):
         """
         :param index: 0-indexed multiview output number
@@ -2248,17 +2816,19 @@ class MultiviewPropertiesCommand(Command):
         self.layout = layout
         self.swap = swap
 
-    def get_command(self):
+    def _pack_args(self):
         mask = 0
-        if self.layout is not None:
+        layout = self.layout
+        if layout is None:
+            layout = 0
+        else:
             mask |= 1 << 0
-        if self.swap is not None:
+        swap = self.swap
+        if swap is None:
+            swap = False
+        else:
             mask |= 1 << 1
-
-        layout = 0 if self.layout is None else self.layout
-        swap = False if self.swap is None else self.swap
-        data = struct.pack('>BBB?', mask, self.index, layout, swap)
-        return self._make_command('CMvP', data)
+        return (mask, self.index, layout, swap)
 
 
 class MultiviewInputCommand(Command):
@@ -2275,6 +2845,10 @@ class MultiviewInputCommand(Command):
 
     """
 
+    __slots__ = ('index', 'window', 'source')
+    _NAME = b'CMvI'
+    _STRUCT = struct.Struct('>BBH')
+
     def __init__(self, index, window, source):
         """
         :param index: 0-indexed multiview output number
@@ -2285,9 +2859,8 @@ class MultiviewInputCommand(Command):
         self.window = window
         self.source = source
 
-    def get_command(self):
-        data = struct.pack('>BBH', self.index, self.window, self.source)
-        return self._make_command('CMvI', data)
+    def _pack_args(self):
+        return (self.index, self.window, self.source)
 
 
 class LockCommand(Command):
@@ -2304,6 +2877,10 @@ class LockCommand(Command):
 
     """
 
+    __slots__ = ('store', 'state')
+    _NAME = b'LOCK'
+    _STRUCT = struct.Struct('>H?x')
+
     def __init__(self, store, state):
         """
         :param store: Store number to get the lock for
@@ -2312,9 +2889,8 @@ class LockCommand(Command):
         self.store = store
         self.state = state
 
-    def get_command(self):
-        data = struct.pack('>H?x', self.store, self.state)
-        return self._make_command('LOCK', data)
+    def _pack_args(self):
+        return (self.store, self.state)
 
 
 class PartialLockCommand(Command):
@@ -2331,6 +2907,10 @@ class PartialLockCommand(Command):
 
     """
 
+    __slots__ = ('store', 'slot')
+    _NAME = b'PLCK'
+    _STRUCT = struct.Struct('>HH BBxx')
+
     def __init__(self, store, slot):
         """
         :param store: Store number to request a lock for
@@ -2339,9 +2919,8 @@ class PartialLockCommand(Command):
         self.store = store
         self.slot = slot
 
-    def get_command(self):
-        data = struct.pack('>HH BBxx', self.store, self.slot, 0xff, 0x01)
-        return self._make_command('PLCK', data)
+    def _pack_args(self):
+        return (self.store, self.slot, 0xff, 0x01)
 
 
 class TransferDownloadRequestCommand(Command):
@@ -2359,6 +2938,10 @@ class TransferDownloadRequestCommand(Command):
 
     """
 
+    __slots__ = ('transfer', 'store', 'slot')
+    _NAME = b'FTSU'
+    _STRUCT = struct.Struct('>HHI 4B')
+
     def __init__(self, transfer, store, slot):
         """
         :param transfer: Unique transfer number
@@ -2369,7 +2952,7 @@ class TransferDownloadRequestCommand(Command):
         self.store = store
         self.slot = slot
 
-    def get_command(self):
+    def _pack_args(self):
         # Special case for macro downloads, not sure why
         if self.store == 0xffff:
             u1 = 0x03
@@ -2378,8 +2961,7 @@ class TransferDownloadRequestCommand(Command):
         u2 = 0xd0
         u3 = 0x9b
         u4 = 0x8c
-        data = struct.pack('>HHI 4B', self.transfer, self.store, self.slot, u1, u2, u3, u4)
-        return self._make_command('FTSU', data)
+        return (self.transfer, self.store, self.slot, u1, u2, u3, u4)
 
 
 class TransferUploadRequestCommand(Command):
@@ -2410,6 +2992,10 @@ class TransferUploadRequestCommand(Command):
 
     """
 
+    __slots__ = ('transfer', 'store', 'slot', 'length', 'mode')
+    _NAME = b'FTSD'
+    _STRUCT = struct.Struct('>HHxxHIHxx')
+
     MODE_WRITE_RLE = 1
     MODE_WRITE = 256
     MODE_ERASE = 512
@@ -2426,9 +3012,8 @@ class TransferUploadRequestCommand(Command):
         self.length = length
         self.mode = mode
 
-    def get_command(self):
-        data = struct.pack('>HHxxHIHxx', self.transfer, self.store, self.slot, self.length, self.mode)
-        return self._make_command('FTSD', data)
+    def _pack_args(self):
+        return (self.transfer, self.store, self.slot, self.length, self.mode)
 
 
 class TransferDataCommand(Command):
@@ -2445,6 +3030,11 @@ class TransferDataCommand(Command):
 
     """
 
+    __slots__ = ('transfer', 'data')
+    _NAME = b'FTDa'
+    # The payload is variable length, only the packet header and transfer header are fused
+    _PACKET = struct.Struct(_HEADER.format + ' HH')
+
     def __init__(self, transfer, data):
         """
         :param transfer: Unique transfer number
@@ -2453,9 +3043,25 @@ class TransferDataCommand(Command):
         self.transfer = transfer
         self.data = data
 
+    def _packet_size(self):
+        return self._PACKET.size + len(self.data)
+
     def get_command(self):
-        data = struct.pack('>HH', self.transfer, len(self.data))
-        return self._make_command('FTDa', data + self.data)
+        size = len(self.data)
+        return self._PACKET.pack(size + self._PACKET.size, self._NAME, self.transfer, size) + self.data
+
+    def get_command_into(self, buffer, offset=0):
+        data = self.data
+        size = len(data)
+        start = offset + self._PACKET.size
+        end = start + size
+        # Slice assignment would grow a bytearray that is too short instead of failing like pack_into does
+        if end > len(buffer):
+            raise struct.error('command needs {} bytes at offset {}, buffer is {} bytes'.format(end - offset, offset,
+                                                                                                len(buffer)))
+        self._PACKET.pack_into(buffer, offset, end - offset, self._NAME, self.transfer, size)
+        buffer[start:end] = data
+        return end - offset
 
 
 class TransferFileDataCommand(Command):
@@ -2475,24 +3081,27 @@ class TransferFileDataCommand(Command):
 
     """
 
+    __slots__ = ('transfer', 'name', 'description', 'hash')
+    _NAME = b'FTFD'
+    _STRUCT = struct.Struct('>H 64s 128s 16s 2x')
+
     def __init__(self, transfer, hash, name=None, description=None):
         """
         :param transfer: Unique transfer number
         :param name: Filename
         :param description: File description
-        :param hash: Data MD5 hash
+        :param hash: Data MD5 hash as the raw 16 byte digest(), not the hexdigest()
         """
         self.transfer = transfer
         self.name = name
         self.description = description
         self.hash = hash
 
-    def get_command(self):
+    def _pack_args(self):
         name = self.name.encode() if self.name is not None else b''
         description = self.description.encode() if self.description is not None else b''
 
-        data = struct.pack('>H 64s 128s 16s 2x', self.transfer, name, description, self.hash)
-        return self._make_command('FTFD', data)
+        return (self.transfer, name, description, self.hash)
 
 
 class TransferAckCommand(Command):
@@ -2508,6 +3117,10 @@ class TransferAckCommand(Command):
 
     """
 
+    __slots__ = ('transfer', 'slot')
+    _NAME = b'FTUA'
+    _STRUCT = struct.Struct('>HH')
+
     def __init__(self, transfer, slot):
         """
         :param transfer: Unique transfer number
@@ -2516,9 +3129,8 @@ class TransferAckCommand(Command):
         self.transfer = transfer
         self.slot = slot
 
-    def get_command(self):
-        data = struct.pack('>HH', self.transfer, self.slot)
-        return self._make_command('FTUA', data)
+    def _pack_args(self):
+        return (self.transfer, self.slot)
 
 
 class SendAudioLevelsCommand(Command):
@@ -2534,6 +3146,11 @@ class SendAudioLevelsCommand(Command):
 
     """
 
+    __slots__ = ('enable',)
+    _NAME = b'SALN'
+    _STRUCT = struct.Struct('>? 3x')
+    _CACHE_PACKETS = True
+
     def __init__(self, enable):
         """
         :param transfer: Unique transfer number
@@ -2541,9 +3158,8 @@ class SendAudioLevelsCommand(Command):
         """
         self.enable = enable
 
-    def get_command(self):
-        data = struct.pack('>? 3x', self.enable)
-        return self._make_command('SALN', data)
+    def _pack_args(self):
+        return (self.enable,)
 
 
 class SendFairlightLevelsCommand(Command):
@@ -2560,15 +3176,19 @@ class SendFairlightLevelsCommand(Command):
 
     """
 
+    __slots__ = ('enable',)
+    _NAME = b'SFLN'
+    _STRUCT = struct.Struct('>? 3x')
+    _CACHE_PACKETS = True
+
     def __init__(self, enable):
         """
         :param enable: Enable or disable receiving audio level data
         """
         self.enable = enable
 
-    def get_command(self):
-        data = struct.pack('>? 3x', self.enable)
-        return self._make_command('SFLN', data)
+    def _pack_args(self):
+        return (self.enable,)
 
 
 class CameraControlCommand(Command):
@@ -2590,6 +3210,31 @@ class CameraControlCommand(Command):
     ====== ==== ====== ===========
     """
 
+    __slots__ = ('destination', 'category', 'parameter', 'relative', 'datatype', 'data')
+    _NAME = b'CCmd'
+    # Header, the fixed fields and the elements block, the data block is packed separately since its layout varies
+    _PACKET = struct.Struct(_HEADER.format + ' 5B 11B')
+    # Position of the element count in the elements block, per datatype
+    _COUNT_OFFSET = {
+        0: 2,
+        1: 2,
+        2: 2,
+        3: 4,
+        4: 2,
+        5: 2,
+        128: 4
+    }
+    # Struct format character per datatype, strings are packed as a single string of their length
+    _DATA_FORMATS = {
+        0: '?',
+        1: 'b',
+        2: 'h',
+        3: 'i',
+        4: 'q',
+        5: 's',
+        128: 'h'
+    }
+
     def __init__(self, destination, category, parameter, relative=False, datatype=None, data=None):
         """
         :param destination: Camera index, or 255 for broadcast
@@ -2606,47 +3251,43 @@ class CameraControlCommand(Command):
         self.datatype = datatype if datatype is not None else 0
         self.data = data
 
+    def _data_struct(self):
+        # Compiled and padded layout of the data block, None for commands without data
+        data = self.data
+        if data is None:
+            return None
+        if self.datatype == 5:
+            return _camera_data_struct(len(data[0]), 's')
+        return _camera_data_struct(len(data), self._DATA_FORMATS[self.datatype])
+
+    def _packet_size(self):
+        data_struct = self._data_struct()
+        if data_struct is None:
+            return self._PACKET.size
+        return self._PACKET.size + data_struct.size
+
     def get_command(self):
-        count = 0
-        if self.data is not None:
-            count = len(self.data)
-        data = struct.pack('>5B', self.destination, self.category, self.parameter, self.relative, self.datatype)
+        buffer = bytearray(self._packet_size())
+        self.get_command_into(buffer)
+        return bytes(buffer)
+
+    def get_command_into(self, buffer, offset=0):
+        data = self.data
         elements = [0] * 11
-        countoffset = {
-            0: 2,
-            1: 2,
-            2: 2,
-            3: 4,
-            4: 2,
-            5: 2,
-            128: 4
-        }
-        elements[countoffset[self.datatype]] = count
-        data += struct.pack('>11B', *elements)
-        if self.data is not None:
-            fmt = '>{}'.format(count)
-            if self.datatype == 5:
-                fmt = '>{}s'.format(len(self.data[0]))
-            fmtmap = {
-                0: '?',
-                1: 'b',
-                2: 'h',
-                3: 'i',
-                4: 'q',
-                5: '',
-                128: 'h'
-            }
-            fmt += fmtmap[self.datatype]
+        elements[self._COUNT_OFFSET[self.datatype]] = len(data) if data is not None else 0
+        data_struct = self._data_struct()
+        size = self._PACKET.size
+        if data_struct is not None:
+            size += data_struct.size
+        self._PACKET.pack_into(buffer, offset, size, self._NAME, self.destination, self.category, self.parameter,
+                               self.relative, self.datatype, *elements)
+        if data_struct is not None:
             if self.datatype == 128:
-                for i in range(0, len(self.data)):
-                    self.data[i] = int(self.data[i] * (2 ** 11))
+                data[:] = [int(value * 2048) for value in data]
             elif self.datatype == 5:
-                for i in range(0, len(self.data)):
-                    self.data[i] = self.data[i].encode()
-            packed_data = struct.pack(fmt, *self.data)
-            packed_data += b'\0' * (8 - len(packed_data))
-            data += packed_data
-        return self._make_command('CCmd', data)
+                data[:] = [value.encode() for value in data]
+            data_struct.pack_into(buffer, offset + self._PACKET.size, *data)
+        return size
 
 
 class VideoModeCommand(Command):
@@ -2663,15 +3304,18 @@ class VideoModeCommand(Command):
 
     """
 
+    __slots__ = ('mode',)
+    _NAME = b'CVdM'
+    _STRUCT = struct.Struct('>B3x')
+
     def __init__(self, mode):
         """
         :param mode: The new video mode ID
         """
         self.mode = mode
 
-    def get_command(self):
-        data = struct.pack('>B3x', self.mode)
-        return self._make_command('CVdM', data)
+    def _pack_args(self):
+        return (self.mode,)
 
 
 class AutoInputVideoModeCommand(Command):
@@ -2688,15 +3332,18 @@ class AutoInputVideoModeCommand(Command):
 
     """
 
+    __slots__ = ('enable',)
+    _NAME = b'AiVM'
+    _STRUCT = struct.Struct('>?3x')
+
     def __init__(self, enable):
         """
         :param enable: Set auto mode enabled or disabled
         """
         self.enable = enable
 
-    def get_command(self):
-        data = struct.pack('>?3x', self.enable)
-        return self._make_command('AiVM', data)
+    def _pack_args(self):
+        return (self.enable,)
 
 
 class InputPropertiesCommand(Command):
@@ -2716,6 +3363,10 @@ class InputPropertiesCommand(Command):
 
     """
 
+    __slots__ = ('source_index', 'label', 'short_label', 'port_type')
+    _NAME = b'CInL'
+    _STRUCT = struct.Struct('>Bx H 20s 4s Hxx')
+
     def __init__(self, source_index, label=None, short_label=None, port_type=None):
         """
         :param source_index: Input index to change the properties for
@@ -2728,21 +3379,27 @@ class InputPropertiesCommand(Command):
         self.short_label = short_label
         self.port_type = port_type
 
-    def get_command(self):
+    def _pack_args(self):
         mask = 0
-        if self.label is not None:
+        label = self.label
+        if label is None:
+            label = b''
+        else:
             mask |= 1 << 0
-        if self.short_label is not None:
+            label = label.encode()
+        short = self.short_label
+        if short is None:
+            short = b''
+        else:
             mask |= 1 << 1
-        if self.port_type is not None:
+            short = short.encode()
+        port_type = self.port_type
+        if port_type is None:
+            port_type = 0
+        else:
             mask |= 1 << 2
 
-        label = self.label.encode() if self.label is not None else b''
-        short = self.short_label.encode() if self.short_label is not None else b''
-        port_type = self.port_type if self.port_type is not None else 0
-
-        data = struct.pack('>Bx H 20s 4s Hxx', mask, self.source_index, label, short, port_type)
-        return self._make_command('CInL', data)
+        return (mask, self.source_index, label, short, port_type)
 
 
 class TimeRequestCommand(Command):
@@ -2751,8 +3408,13 @@ class TimeRequestCommand(Command):
     This command has no arguments
     """
 
-    def get_command(self):
-        return self._make_command('TiRq', b'')
+    __slots__ = ()
+    _NAME = b'TiRq'
+    _STRUCT = struct.Struct('>')
+    _CACHE_PACKETS = True
+
+    def _pack_args(self):
+        return ()
 
 
 class TransferCompleteCommand(Command):
@@ -2771,6 +3433,10 @@ class TransferCompleteCommand(Command):
 
     """
 
+    __slots__ = ('store', 'slot', 'upload')
+    _NAME = b'*XFC'
+    _STRUCT = struct.Struct('>HH ?xxx')
+
     def __init__(self, store, slot, upload):
         """
         :param store: Transfer store index
@@ -2781,6 +3447,5 @@ class TransferCompleteCommand(Command):
         self.slot = slot
         self.upload = upload
 
-    def get_command(self):
-        data = struct.pack('>HH ?xxx', self.store, self.slot, self.upload)
-        return self._make_command('*XFC', data)
+    def _pack_args(self):
+        return (self.store, self.slot, self.upload)
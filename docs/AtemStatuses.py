@@ -1,16 +1,100 @@
 import colorsys
+import functools
 import struct
 import math
 
-from pyatem.hexdump import hexdump
+# Packet header shared by every field: total length, 2 bytes padding and the 4 character field name
+_HEADER = struct.Struct('!H2x 4s')
+
+# u16 item count that leads the variable length fields
+_COUNT = struct.Struct('>H')
+
+
+def _bit_flags(width):
+    """
+    Build a lookup table that maps every possible byte to a tuple with the state of its lowest `width` bits, so a
+    bitfield is decoded into booleans with a single index instead of a mask and compare per bit.
+    """
+    return tuple(tuple(byte & (1 << bit) != 0 for bit in range(width)) for byte in range(256))
+
+
+# (PROGRAM, PREVIEW) for every possible tally bitfield byte
+_TALLY_STATES = _bit_flags(2)
+
+
+@functools.lru_cache(maxsize=256)
+def _hls_to_rgb(h, l, s):
+    """
+    colorsys.hls_to_rgb with the results cached, the mixer only reports a handful of distinct colors and they get
+    converted again on every redraw.
+    """
+    return colorsys.hls_to_rgb(h, l, s)
+
+
+# Curve of the fairlight meters, the levels are sent as -10000 - 0 and displayed as -60dB - 0dB
+_FAIRLIGHT_COEFF = 10 ** (40 / 20)
+_FAIRLIGHT_LOG_COEFF = math.log(_FAIRLIGHT_COEFF + 1)
+
+
+@functools.lru_cache(maxsize=None)
+def _fairlight_level(value):
+    """
+    Convert a fairlight meter value to dB. The input is an i16 so the cache is bounded, in practice only the 10001
+    values from -10000 to 0 are sent and every meter packet has 14 or 15 of them.
+    """
+    if value == 0:
+        return 0
+    value += 10000
+    value /= 10000
+    if value == 0:
+        return -60
+    val = (math.exp(_FAIRLIGHT_LOG_COEFF * value) - 1) / _FAIRLIGHT_COEFF
+    val = val * 60 - 60
+    return val
+
+
+@functools.lru_cache(maxsize=1024)
+def _strip_id(source, subchannel=0):
+    """
+    Audio strip identifier in {source}.{subchannel} format. The same few dozen strips are reported over and over, so
+    the strings are built once and shared.
+    """
+    return '{}.{}'.format(source, subchannel)
+
+
+@functools.lru_cache(maxsize=64)
+def _mediaplayer_file_struct(name_length):
+    """
+    Compiled MPfe layout for a slot name of name_length bytes. The length is taken from the packet, so the cache is
+    bounded instead of keeping a struct for every length ever received.
+    """
+    return struct.Struct('>Bx H ? 16s 2x {}p'.format(name_length))
+
+
+@functools.lru_cache(maxsize=64)
+def _camera_data_struct(code, count):
+    """
+    Compiled CCdP data layout of count values of the struct format code. The count is taken from the packet header,
+    so the cache is bounded.
+    """
+    return struct.Struct('>' + code * count)
 
 
 class FieldBase:
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # The field name is encoded once per class for make_packet
+        code = getattr(cls, 'CODE', None)
+        if code is not None:
+            cls._CODE_BYTES = code.encode()
+
     def _get_string(self, raw):
-        return raw.split(b'\x00')[0].decode()
+        return raw.partition(b'\x00')[0].decode()
 
     def make_packet(self):
-        header = struct.pack('!H2x 4s', len(self.raw) + 8, self.__class__.CODE.encode())
+        header = _HEADER.pack(len(self.raw) + 8, self._CODE_BYTES)
         return header + self.raw
 
 
@@ -31,18 +115,20 @@ class FirmwareVersionField(FieldBase):
     :ivar minor: Minor firmware version
     """
 
+    __slots__ = ('raw', 'major', 'minor', 'version')
     CODE = "_ver"
+    _STRUCT = struct.Struct('>HH')
 
     def __init__(self, raw):
         """
         :param raw:
         """
         self.raw = raw
-        self.major, self.minor = struct.unpack('>HH', raw)
+        self.major, self.minor = self._STRUCT.unpack(raw)
         self.version = "{}.{}".format(self.major, self.minor)
 
     def __repr__(self):
-        return '<firmware-version {}>'.format(self.version)
+        return f'<firmware-version {self.version}>'
 
 
 class TimeField(FieldBase):
@@ -68,17 +154,20 @@ class TimeField(FieldBase):
     :ivar frames: Timecode frames field
     :ivar dropframe: Is dropframe
     """
+
+    __slots__ = ('raw', 'hours', 'minutes', 'seconds', 'frames', 'dropframe')
     CODE = "Time"
+    _STRUCT = struct.Struct('>BBBB?3x')
 
     def __init__(self, raw):
         self.raw = raw
-        self.hours, self.minutes, self.seconds, self.frames, self.dropframe = struct.unpack('>BBBB?3x', raw)
+        self.hours, self.minutes, self.seconds, self.frames, self.dropframe = self._STRUCT.unpack(raw)
 
     def total_seconds(self):
         return self.seconds + (60 * self.minutes) + (60 * 60 * self.hours)
 
     def __repr__(self):
-        return '<time {}>'.format(f'{self.hours}:{self.minutes}:{self.seconds}:{self.frames}')
+        return f'<time {self.hours}:{self.minutes}:{self.seconds}:{self.frames}>'
 
 
 class TimeConfigField(FieldBase):
@@ -96,14 +185,17 @@ class TimeConfigField(FieldBase):
 
     :ivar mode: Timecode mode
     """
+
+    __slots__ = ('raw', 'mode')
     CODE = "TCCc"
+    _STRUCT = struct.Struct('>Bxxx')
 
     def __init__(self, raw):
         self.raw = raw
-        self.mode = struct.unpack('>Bxxx', raw)
+        self.mode, = self._STRUCT.unpack(raw)
 
     def __repr__(self):
-        return '<time-config mode={}>'.format(self.mode)
+        return f'<time-config mode={self.mode}>'
 
 
 class ProductNameField(FieldBase):
@@ -121,6 +213,7 @@ class ProductNameField(FieldBase):
     :ivar name: User friendly product name
     """
 
+    __slots__ = ('raw', 'name')
     CODE = "_pin"
 
     def __init__(self, raw):
@@ -128,7 +221,7 @@ class ProductNameField(FieldBase):
         self.name = self._get_string(raw)
 
     def __repr__(self):
-        return '<product-name {}>'.format(self.name)
+        return f'<product-name {self.name}>'
 
 
 class MixerEffectConfigField(FieldBase):
@@ -151,14 +244,16 @@ class MixerEffectConfigField(FieldBase):
     :ivar keyers: Number of upstream keyers on this M/E
     """
 
+    __slots__ = ('raw', 'index', 'keyers')
     CODE = "_MeC"
+    _STRUCT = struct.Struct('>2B2x')
 
     def __init__(self, raw):
         self.raw = raw
-        self.index, self.keyers = struct.unpack('>2B2x', raw)
+        self.index, self.keyers = self._STRUCT.unpack(raw)
 
     def __repr__(self):
-        return '<mixer-effect-config m/e {}: keyers={}>'.format(self.index, self.keyers)
+        return f'<mixer-effect-config m/e {self.index}: keyers={self.keyers}>'
 
 
 class MediaplayerSlotsField(FieldBase):
@@ -179,14 +274,16 @@ class MediaplayerSlotsField(FieldBase):
     :ivar clips: Number of clip slots
     """
 
+    __slots__ = ('raw', 'stills', 'clips')
     CODE = "_mpl"
+    _STRUCT = struct.Struct('>2B2x')
 
     def __init__(self, raw):
         self.raw = raw
-        self.stills, self.clips = struct.unpack('>2B2x', raw)
+        self.stills, self.clips = self._STRUCT.unpack(raw)
 
     def __repr__(self):
-        return '<mediaplayer-slots: stills={} clips={}>'.format(self.stills, self.clips)
+        return f'<mediaplayer-slots: stills={self.stills} clips={self.clips}>'
 
 
 class MediaplayerSelectedField(FieldBase):
@@ -210,14 +307,16 @@ class MediaplayerSelectedField(FieldBase):
     :ivar slot: Source index
     """
 
+    __slots__ = ('raw', 'index', 'source_type', 'slot')
     CODE = "MPCE"
+    _STRUCT = struct.Struct('>BBBx')
 
     def __init__(self, raw):
         self.raw = raw
-        self.index, self.source_type, self.slot = struct.unpack('>BBBx', raw)
+        self.index, self.source_type, self.slot = self._STRUCT.unpack(raw)
 
     def __repr__(self):
-        return '<mediaplayer-selected: index={} type={} slot={}>'.format(self.index, self.source_type, self.slot)
+        return f'<mediaplayer-selected: index={self.index} type={self.source_type} slot={self.slot}>'
 
 
 class VideoModeField(FieldBase):
@@ -274,49 +373,56 @@ class VideoModeField(FieldBase):
     :ivar rate: refresh rate of the mode
     """
 
+    __slots__ = ('raw', 'mode', 'resolution', 'interlaced', 'rate', 'widescreen')
     CODE = "VidM"
-
-    def __init__(self, raw):
-        self.raw = raw
-        self.mode, = struct.unpack('>1B3x', raw)
-
-        # Resolution, Interlaced, Rate, Widescreen
-        modes = {
-            0: (525, True, 59.94, False),
-            1: (625, True, 50, False),
-            2: (525, True, 59.94, True),
-            3: (625, True, 50, True),
-            4: (720, False, 50, True),
-            5: (720, False, 59.94, True),
-            6: (1080, True, 50, True),
-            7: (1080, True, 59.94, True),
-            8: (1080, False, 23.98, True),
-            9: (1080, False, 24, True),
-            10: (1080, False, 25, True),
-            11: (1080, False, 29.97, True),
-            12: (1080, False, 50, True),
-            13: (1080, False, 59.94, True),
-            14: (2160, False, 23.98, True),
-            15: (2160, False, 24, True),
-            16: (2160, False, 25, True),
-            17: (2160, False, 29.97, True),
-            18: (2160, False, 50, True),
-            19: (2160, False, 59.94, True),
-            20: (4320, False, 23.98, True),
-            21: (4320, False, 24, True),
-            22: (4320, False, 25, True),
-            23: (4320, False, 29.97, True),
-            24: (4320, False, 50, True),
-            25: (4320, False, 59.94, True),
-            26: (1080, False, 30, True),
-            27: (1080, False, 60, True),
-        }
-
-        if self.mode in modes:
-            self.resolution = modes[self.mode][0]
-            self.interlaced = modes[self.mode][1]
-            self.rate = modes[self.mode][2]
-            self.widescreen = modes[self.mode][3]
+    _STRUCT = struct.Struct('>1B3x')
+    # Resolution, Interlaced, Rate, Widescreen
+    _MODES = {
+        0: (525, True, 59.94, False),
+        1: (625, True, 50, False),
+        2: (525, True, 59.94, True),
+        3: (625, True, 50, True),
+        4: (720, False, 50, True),
+        5: (720, False, 59.94, True),
+        6: (1080, True, 50, True),
+        7: (1080, True, 59.94, True),
+        8: (1080, False, 23.98, True),
+        9: (1080, False, 24, True),
+        10: (1080, False, 25, True),
+        11: (1080, False, 29.97, True),
+        12: (1080, False, 50, True),
+        13: (1080, False, 59.94, True),
+        14: (2160, False, 23.98, True),
+        15: (2160, False, 24, True),
+        16: (2160, False, 25, True),
+        17: (2160, False, 29.97, True),
+        18: (2160, False, 50, True),
+        19: (2160, False, 59.94, True),
+        20: (4320, False, 23.98, True),
+        21: (4320, False, 24, True),
+        22: (4320, False, 25, True),
+        23: (4320, False, 29.97, True),
+        24: (4320, False, 50, True),
+        25: (4320, False, 59.94, True),
+        26: (1080, False, 30, True),
+        27: (1080, False, 60, True),
+    }
+    _RESOLUTIONS = {
+        525: (720, 480),
+        625: (720, 576),
+        720: (1280, 720),
+        1080: (1920, 1080),
+        2160: (3840, 2160),
+        4320: (7680, 4320),
+    }
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.mode, = self._STRUCT.unpack(raw)
+
+        mode = self._MODES.get(self.mode)
+        if mode is not None:
+            self.resolution, self.interlaced, self.rate, self.widescreen = mode
 
     def get_label(self):
         if self.resolution is None:
@@ -338,18 +444,10 @@ class VideoModeField(FieldBase):
         return w * h
 
     def get_resolution(self):
-        lut = {
-            525: (720, 480),
-            625: (720, 576),
-            720: (1280, 720),
-            1080: (1920, 1080),
-            2160: (3840, 2160),
-            4320: (7680, 4320),
-        }
-        return lut[self.resolution]
+        return self._RESOLUTIONS[self.resolution]
 
     def __repr__(self):
-        return '<video-mode: mode={}: {}>'.format(self.mode, self.get_label())
+        return f'<video-mode: mode={self.mode}: {self.get_label()}>'
 
 
 class VideoModeCapabilityField(FieldBase):
@@ -418,14 +516,21 @@ class VideoModeCapabilityField(FieldBase):
     :ivar rate: refresh rate of the mode
     """
 
+    __slots__ = ('raw', 'modes')
     CODE = "_VMC"
+    _MODE_STRUCT = struct.Struct('>B3x I I ?')
+    # Packed VidM payload per mode number. Only the immutable bytes are shared, every mode in a parsed field is its own
+    # VideoModeField so callers can't change the modes of other packets.
+    _MODE_RAWS = {}
 
     def __init__(self, raw):
         self.raw = raw
-        count, = struct.unpack_from('>H', raw, 0)
+        count, = _COUNT.unpack_from(raw, 0)
+        end = 4 + (count * self._MODE_STRUCT.size)
+        if count and len(raw) < end:
+            raise struct.error('_VMC field is too short for {} modes'.format(count))
         self.modes = []
-        for i in range(0, count):
-            vidm, multiview, downscale, reconfig = struct.unpack_from('>B3x I I ?', raw, 4 + (i * 13))
+        for vidm, multiview, downscale, reconfig in self._MODE_STRUCT.iter_unpack(memoryview(raw)[4:end]):
             self.modes.append({
                 'modenum': vidm,
                 'mode': self._int_to_mode(vidm),
@@ -435,21 +540,27 @@ class VideoModeCapabilityField(FieldBase):
             })
 
     def _bitfield_to_modes(self, bitfield):
+        # Walk the set bits from low to high instead of testing all 32
         result = []
-        for i in range(0, 32):
-            if bitfield & (2 ** i):
-                result.append(self._int_to_mode(i))
+        while bitfield:
+            lowest = bitfield & -bitfield
+            bitfield ^= lowest
+            result.append(self._int_to_mode(lowest.bit_length() - 1))
         return result
 
     def _int_to_mode(self, mode):
-        return VideoModeField(struct.pack('>1B3x', mode))
+        raw = self._MODE_RAWS.get(mode)
+        if raw is None:
+            raw = VideoModeField._STRUCT.pack(mode)
+            self._MODE_RAWS[mode] = raw
+        return VideoModeField(raw)
 
     def __repr__(self):
         modenames = []
         for mode in self.modes:
             modenames.append(mode['mode'].get_label())
         lst = ' '.join(modenames)
-        return '<video-mode-capability: {}>'.format(lst)
+        return f'<video-mode-capability: {lst}>'
 
 
 class InputPropertiesField(FieldBase):
@@ -530,6 +641,10 @@ class InputPropertiesField(FieldBase):
     :ivar available_me2: Source can be routed to M/E 2
     """
 
+    __slots__ = ('raw', 'index', 'name', 'short_name', 'source_category', 'port_type', 'source_ports', 'available_aux',
+                 'available_multiview', 'available_supersource_art', 'available_supersource_box',
+                 'available_key_source', 'available_aux1', 'available_aux2', 'available_me1', 'available_me2')
+
     PORT_EXTERNAL = 0
     PORT_BLACK = 1
     PORT_BARS = 2
@@ -543,10 +658,13 @@ class InputPropertiesField(FieldBase):
     PORT_KEY_MASK = 130
     PORT_MULTIVIEW_OUTPUT = 131
     CODE = "InPr"
+    _AVAILABILITY_FLAGS = _bit_flags(7)
+    _ME_FLAGS = _bit_flags(2)
+    _STRUCT = struct.Struct('>H 20s 4s 10B')
 
     def __init__(self, raw):
         self.raw = raw
-        fields = struct.unpack('>H 20s 4s 10B', raw)
+        fields = self._STRUCT.unpack(raw)
         self.index = fields[0]
         self.name = self._get_string(fields[1])
         self.short_name = self._get_string(fields[2])
@@ -554,19 +672,14 @@ class InputPropertiesField(FieldBase):
         self.port_type = fields[9]
         self.source_ports = fields[6]
 
-        self.available_aux = fields[11] & (1 << 0) != 0
-        self.available_multiview = fields[11] & (1 << 1) != 0
-        self.available_supersource_art = fields[11] & (1 << 2) != 0
-        self.available_supersource_box = fields[11] & (1 << 3) != 0
-        self.available_key_source = fields[11] & (1 << 4) != 0
-        self.available_aux1 = fields[11] & (1 << 5) != 0
-        self.available_aux2 = fields[11] & (1 << 6) != 0
+        (self.available_aux, self.available_multiview, self.available_supersource_art,
+         self.available_supersource_box, self.available_key_source, self.available_aux1,
+         self.available_aux2) = self._AVAILABILITY_FLAGS[fields[11]]
 
-        self.available_me1 = fields[12] & (1 << 0) != 0
-        self.available_me2 = fields[12] & (1 << 1) != 0
+        self.available_me1, self.available_me2 = self._ME_FLAGS[fields[12]]
 
     def __repr__(self):
-        return '<input-properties: index={} name={} button={}>'.format(self.index, self.name, self.short_name)
+        return f'<input-properties: index={self.index} name={self.name} button={self.short_name}>'
 
 
 class ProgramBusInputField(FieldBase):
@@ -589,14 +702,16 @@ class ProgramBusInputField(FieldBase):
     :ivar source: Input source index, refers to an InputPropertiesField index
     """
 
+    __slots__ = ('raw', 'index', 'source')
     CODE = "PrgI"
+    _STRUCT = struct.Struct('>BxH')
 
     def __init__(self, raw):
         self.raw = raw
-        self.index, self.source = struct.unpack('>BxH', raw)
+        self.index, self.source = self._STRUCT.unpack(raw)
 
     def __repr__(self):
-        return '<program-bus-input: me={} source={}>'.format(self.index, self.source)
+        return f'<program-bus-input: me={self.index} source={self.source}>'
 
 
 class PreviewBusInputField(FieldBase):
@@ -622,18 +737,20 @@ class PreviewBusInputField(FieldBase):
     :ivar in_program: Preview source is mixed into progam
     """
 
+    __slots__ = ('raw', 'index', 'source', 'in_program')
     CODE = "PrvI"
+    _STRUCT = struct.Struct('>B x H B 3x')
 
     def __init__(self, raw):
         self.raw = raw
-        self.index, self.source, in_program = struct.unpack('>B x H B 3x', raw)
+        self.index, self.source, in_program = self._STRUCT.unpack(raw)
         self.in_program = in_program == 1
 
     def __repr__(self):
         in_program = ''
         if self.in_program:
             in_program = ' in-program'
-        return '<preview-bus-input: me={} source={}{}>'.format(self.index, self.source, in_program)
+        return f'<preview-bus-input: me={self.index} source={self.source}{in_program}>'
 
 
 class TransitionSettingsField(FieldBase):
@@ -676,31 +793,32 @@ class TransitionSettingsField(FieldBase):
 
     """
 
+    __slots__ = ('raw', 'index', 'style', 'style_next', 'next_transition_bkgd', 'next_transition_key1',
+                 'next_transition_key2', 'next_transition_key3', 'next_transition_key4', 'next_transition_bkgd_next',
+                 'next_transition_key1_next', 'next_transition_key2_next', 'next_transition_key3_next',
+                 'next_transition_key4_next')
+
     STYLE_MIX = 0
     STYLE_DIP = 1
     STYLE_WIPE = 2
     STYLE_DVE = 3
     STYLE_STING = 4
     CODE = "TrSS"
+    _LAYER_FLAGS = _bit_flags(5)
+    _STRUCT = struct.Struct('>B 2B 2B 3x')
 
     def __init__(self, raw):
         self.raw = raw
-        self.index, self.style, nt, self.style_next, ntn = struct.unpack('>B 2B 2B 3x', raw)
+        self.index, self.style, nt, self.style_next, ntn = self._STRUCT.unpack(raw)
 
-        self.next_transition_bkgd = nt & (1 << 0) != 0
-        self.next_transition_key1 = nt & (1 << 1) != 0
-        self.next_transition_key2 = nt & (1 << 2) != 0
-        self.next_transition_key3 = nt & (1 << 3) != 0
-        self.next_transition_key4 = nt & (1 << 4) != 0
+        (self.next_transition_bkgd, self.next_transition_key1, self.next_transition_key2,
+         self.next_transition_key3, self.next_transition_key4) = self._LAYER_FLAGS[nt]
 
-        self.next_transition_bkgd_next = ntn & (1 << 0) != 0
-        self.next_transition_key1_next = ntn & (1 << 1) != 0
-        self.next_transition_key2_next = ntn & (1 << 2) != 0
-        self.next_transition_key3_next = ntn & (1 << 3) != 0
-        self.next_transition_key4_next = ntn & (1 << 4) != 0
+        (self.next_transition_bkgd_next, self.next_transition_key1_next, self.next_transition_key2_next,
+         self.next_transition_key3_next, self.next_transition_key4_next) = self._LAYER_FLAGS[ntn]
 
     def __repr__(self):
-        return '<transition-settings: me={} style={}>'.format(self.index, self.style)
+        return f'<transition-settings: me={self.index} style={self.style}>'
 
 
 class TransitionPreviewField(FieldBase):
@@ -723,14 +841,16 @@ class TransitionPreviewField(FieldBase):
     :ivar enabled: True if the transition preview is enabled
     """
 
+    __slots__ = ('raw', 'index', 'enabled')
     CODE = "TsPr"
+    _STRUCT = struct.Struct('>B ? 2x')
 
     def __init__(self, raw):
         self.raw = raw
-        self.index, self.enabled = struct.unpack('>B ? 2x', raw)
+        self.index, self.enabled = self._STRUCT.unpack(raw)
 
     def __repr__(self):
-        return '<transition-preview: me={} enabled={}>'.format(self.index, self.enabled)
+        return f'<transition-preview: me={self.index} enabled={self.enabled}>'
 
 
 class TransitionPositionField(FieldBase):
@@ -758,17 +878,18 @@ class TransitionPositionField(FieldBase):
     :ivar position: Position of the transition, 0-9999
     """
 
+    __slots__ = ('raw', 'index', 'in_transition', 'frames_remaining', 'position')
     CODE = "TrPs"
+    _STRUCT = struct.Struct('>B ? B x H 2x')
 
     def __init__(self, raw):
         self.raw = raw
-        self.index, self.in_transition, self.frames_remaining, position = struct.unpack('>B ? B x H 2x', raw)
+        self.index, self.in_transition, self.frames_remaining, position = self._STRUCT.unpack(raw)
         self.position = position
 
     def __repr__(self):
-        return '<transition-position: me={} frames-remaining={} position={:02f}>'.format(self.index,
-                                                                                         self.frames_remaining,
-                                                                                         self.position)
+        return (f'<transition-position: me={self.index} frames-remaining={self.frames_remaining} '
+                f'position={self.position:02f}>')
 
 
 class TallyIndexField(FieldBase):
@@ -788,21 +909,20 @@ class TallyIndexField(FieldBase):
     :ivar tally: List of tally values, every tally light is represented as a tuple with 2 booleans for PROGRAM and PREVIEW
     """
 
+    __slots__ = ('raw', 'num', 'tally')
     CODE = "TlIn"
 
     def __init__(self, raw):
         self.raw = raw
-        offset = 0
-        self.num, = struct.unpack_from('>H', raw, offset)
-        self.tally = []
-        offset += 2
-        for i in range(0, self.num):
-            tally, = struct.unpack_from('>B', raw, offset)
-            self.tally.append((tally & 1 != 0, tally & 2 != 0))
-            offset += 1
+        self.num, = _COUNT.unpack_from(raw, 0)
+        end = 2 + self.num
+        if len(raw) < end:
+            raise struct.error('TlIn field is too short for {} tally lights'.format(self.num))
+        # Iterating the bytes gives the bitfield of every tally light without a struct call per light
+        self.tally = [_TALLY_STATES[tally] for tally in raw[2:end]]
 
     def __repr__(self):
-        return '<tally-index: num={}, val={}>'.format(self.num, self.tally)
+        return f'<tally-index: num={self.num}, val={self.tally}>'
 
 
 class TallySourceField(FieldBase):
@@ -823,21 +943,21 @@ class TallySourceField(FieldBase):
     :ivar tally: Dict of tally lights, every tally light is represented as a tuple with 2 booleans for PROGRAM and PREVIEW
     """
 
+    __slots__ = ('raw', 'num', 'tally')
     CODE = "TlSr"
+    _TALLY_STRUCT = struct.Struct('>HB')
 
     def __init__(self, raw):
         self.raw = raw
-        offset = 0
-        self.num, = struct.unpack_from('>H', raw, offset)
-        self.tally = {}
-        offset += 2
-        for i in range(0, self.num):
-            source, tally, = struct.unpack_from('>HB', raw, offset)
-            self.tally[source] = (tally & 1 != 0, tally & 2 != 0)
-            offset += 3
+        self.num, = _COUNT.unpack_from(raw, 0)
+        end = 2 + (self.num * 3)
+        if len(raw) < end:
+            raise struct.error('TlSr field is too short for {} tally lights'.format(self.num))
+        entries = self._TALLY_STRUCT.iter_unpack(memoryview(raw)[2:end])
+        self.tally = {source: _TALLY_STATES[tally] for source, tally in entries}
 
     def __repr__(self):
-        return '<tally-source: num={}, val={}>'.format(self.num, self.tally)
+        return f'<tally-source: num={self.num}, val={self.tally}>'
 
 
 class KeyOnAirField(FieldBase):
@@ -860,14 +980,16 @@ class KeyOnAirField(FieldBase):
     :ivar enabled: Wether the keyer is on-air
     """
 
+    __slots__ = ('raw', 'index', 'keyer', 'enabled')
     CODE = "KeOn"
+    _STRUCT = struct.Struct('>BB?x')
 
     def __init__(self, raw):
         self.raw = raw
-        self.index, self.keyer, self.enabled = struct.unpack('>BB?x', raw)
+        self.index, self.keyer, self.enabled = self._STRUCT.unpack(raw)
 
     def __repr__(self):
-        return '<key-on-air: me={}, keyer={}, enabled={}>'.format(self.index, self.keyer, self.enabled)
+        return f'<key-on-air: me={self.index}, keyer={self.keyer}, enabled={self.enabled}>'
 
 
 class ColorGeneratorField(FieldBase):
@@ -891,21 +1013,22 @@ class ColorGeneratorField(FieldBase):
     :ivar enabled: Wether the keyer is on-air
     """
 
+    __slots__ = ('raw', 'index', 'hue', 'saturation', 'luma')
     CODE = "ColV"
+    _STRUCT = struct.Struct('>Bx 3H')
 
     def __init__(self, raw):
         self.raw = raw
-        self.index, self.hue, self.saturation, self.luma = struct.unpack('>Bx 3H', raw)
+        self.index, self.hue, self.saturation, self.luma = self._STRUCT.unpack(raw)
         self.hue = self.hue / 10.0
         self.saturation = self.saturation / 1000.0
         self.luma = self.luma / 1000.0
 
     def get_rgb(self):
-        return colorsys.hls_to_rgb(self.hue / 360.0, self.luma, self.saturation)
+        return _hls_to_rgb(self.hue / 360.0, self.luma, self.saturation)
 
     def __repr__(self):
-        return '<color-generator: index={}, hue={} saturation={} luma={}>'.format(self.index, self.hue, self.saturation,
-                                                                                  self.luma)
+        return f'<color-generator: index={self.index}, hue={self.hue} saturation={self.saturation} luma={self.luma}>'
 
 
 class AuxOutputSourceField(FieldBase):
@@ -926,14 +1049,16 @@ class AuxOutputSourceField(FieldBase):
     :ivar rate: Source index
     """
 
+    __slots__ = ('raw', 'index', 'source')
     CODE = "AuxS"
+    _STRUCT = struct.Struct('>BxH')
 
     def __init__(self, raw):
         self.raw = raw
-        self.index, self.source = struct.unpack('>BxH', raw)
+        self.index, self.source = self._STRUCT.unpack(raw)
 
     def __repr__(self):
-        return '<aux-output-source: aux={}, source={}>'.format(self.index, self.source)
+        return f'<aux-output-source: aux={self.index}, source={self.source}>'
 
 
 class FadeToBlackStateField(FieldBase):
@@ -957,17 +1082,17 @@ class FadeToBlackStateField(FieldBase):
     :ivar frames_remaining: Frames remaining in the transition
     """
 
+    __slots__ = ('raw', 'index', 'done', 'transitioning', 'frames_remaining')
     CODE = "FtbS"
+    _STRUCT = struct.Struct('>B??B')
 
     def __init__(self, raw):
         self.raw = raw
-        self.index, self.done, self.transitioning, self.frames_remaining = struct.unpack('>B??B', raw)
+        self.index, self.done, self.transitioning, self.frames_remaining = self._STRUCT.unpack(raw)
 
     def __repr__(self):
-        return '<fade-to-black-state: me={}, done={}, transitioning={}, frames-remaining={}>'.format(self.index,
-                                                                                                     self.done,
-                                                                                                     self.transitioning,
-                                                                                                     self.frames_remaining)
+        return (f'<fade-to-black-state: me={self.index}, done={self.done}, transitioning={self.transitioning}, '
+                f'frames-remaining={self.frames_remaining}>')
 
 
 class MediaplayerFileInfoField(FieldBase):
@@ -995,17 +1120,16 @@ class MediaplayerFileInfoField(FieldBase):
     :ivar name: Name of the content in the slot
     """
 
+    __slots__ = ('raw', 'type', 'index', 'is_used', 'hash', 'name')
     CODE = "MPfe"
 
     def __init__(self, raw):
         self.raw = raw
-        namelen = max(0, len(raw) - 23)
-        self.type, self.index, self.is_used, self.hash, self.name = struct.unpack('>Bx H ? 16s 2x {}p'.format(namelen),
-                                                                                  raw)
+        field_struct = _mediaplayer_file_struct(max(0, len(raw) - 23))
+        self.type, self.index, self.is_used, self.hash, self.name = field_struct.unpack(raw)
 
     def __repr__(self):
-        return '<mediaplayer-file-info: type={} index={} used={} name={}>'.format(self.type, self.index, self.is_used,
-                                                                                  self.name)
+        return f'<mediaplayer-file-info: type={self.type} index={self.index} used={self.is_used} name={self.name}>'
 
 
 class TopologyField(FieldBase):
@@ -1075,28 +1199,20 @@ class TopologyField(FieldBase):
     :ivar supersources: Number of supersources
     """
 
+    __slots__ = ('raw', 'me_units', 'sources', 'downstream_keyers', 'aux_outputs', 'mixminus_outputs', 'mediaplayers',
+                 'multiviewers', 'rs485', 'hyperdecks', 'dve', 'stingers', 'supersources', 'multiviewer_routable')
     CODE = "_top"
+    _STRUCT = struct.Struct('>13B 15x')
 
     def __init__(self, raw):
         self.raw = raw
-        field = struct.unpack('>28B', raw)
-
-        self.me_units = field[0]
-        self.sources = field[1]
-        self.downstream_keyers = field[2]
-        self.aux_outputs = field[3]
-        self.mixminus_outputs = field[4]
-        self.mediaplayers = field[5]
-        self.multiviewers = field[6]
-        self.rs485 = field[7]
-        self.hyperdecks = field[8]
-        self.dve = field[9]
-        self.stingers = field[10]
-        self.supersources = field[11]
-        self.multiviewer_routable = field[12] == 1
+        (self.me_units, self.sources, self.downstream_keyers, self.aux_outputs, self.mixminus_outputs,
+         self.mediaplayers, self.multiviewers, self.rs485, self.hyperdecks, self.dve, self.stingers,
+         self.supersources, multiviewer_routable) = self._STRUCT.unpack(raw)
+        self.multiviewer_routable = multiviewer_routable == 1
 
     def __repr__(self):
-        return '<topology, me={} sources={} aux={}>'.format(self.me_units, self.sources, self.aux_outputs)
+        return f'<topology, me={self.me_units} sources={self.sources} aux={self.aux_outputs}>'
 
 
 class DkeyPropertiesBaseField(FieldBase):
@@ -1120,14 +1236,16 @@ class DkeyPropertiesBaseField(FieldBase):
     :ivar key_source: Source index for the key input
     """
 
+    __slots__ = ('raw', 'index', 'fill_source', 'key_source')
     CODE = "DskB"
+    _STRUCT = struct.Struct('>BxHH2x')
 
     def __init__(self, raw):
         self.raw = raw
-        self.index, self.fill_source, self.key_source = struct.unpack('>BxHH2x', raw)
+        self.index, self.fill_source, self.key_source = self._STRUCT.unpack(raw)
 
     def __repr__(self):
-        return '<downstream-keyer-base: dsk={}, fill={}, key={}>'.format(self.index, self.fill_source, self.key_source)
+        return f'<downstream-keyer-base: dsk={self.index}, fill={self.fill_source}, key={self.key_source}>'
 
 
 class DkeyPropertiesField(FieldBase):
@@ -1160,27 +1278,18 @@ class DkeyPropertiesField(FieldBase):
     :ivar frames_remaining: Frames remaining in the transition
     """
 
+    __slots__ = ('raw', 'index', 'tie', 'rate', 'premultiplied', 'clip', 'gain', 'invert_key', 'masked', 'top',
+                 'bottom', 'left', 'right')
     CODE = "DskP"
+    _STRUCT = struct.Struct('>B?B ?HH? ?4h 2x')
 
     def __init__(self, raw):
         self.raw = raw
-        field = struct.unpack('>B?B ?HH? ?4h 2B', raw)
-        self.index = field[0]
-        self.tie = field[1]
-        self.rate = field[2]
-        self.premultiplied = field[3]
-        self.clip = field[4]
-        self.gain = field[5]
-        self.invert_key = field[6]
-        self.masked = field[7]
-        self.top = field[8]
-        self.bottom = field[9]
-        self.left = field[10]
-        self.right = field[11]
+        (self.index, self.tie, self.rate, self.premultiplied, self.clip, self.gain, self.invert_key, self.masked,
+         self.top, self.bottom, self.left, self.right) = self._STRUCT.unpack(raw)
 
     def __repr__(self):
-        return '<downstream-keyer-mask: dsk={}, tie={}, rate={}, masked={}>'.format(self.index, self.tie, self.rate,
-                                                                                    self.masked)
+        return f'<downstream-keyer-mask: dsk={self.index}, tie={self.tie}, rate={self.rate}, masked={self.masked}>'
 
 
 class DkeyStateField(FieldBase):
@@ -1207,23 +1316,19 @@ class DkeyStateField(FieldBase):
     :ivar frames_remaining: Frames remaining in transition
     """
 
+    __slots__ = ('raw', 'index', 'on_air', 'is_transitioning', 'is_autotransitioning', 'frames_remaining')
     CODE = "DskS"
+    _STRUCT = struct.Struct('>B 3? B 3x')
 
     def __init__(self, raw):
         self.raw = raw
-        field = struct.unpack('>B 3? B 3x', raw)
-        self.index = field[0]
-        self.on_air = field[1]
-        self.is_transitioning = field[2]
-        self.is_autotransitioning = field[3]
-        self.frames_remaining = field[4]
+        (self.index, self.on_air, self.is_transitioning, self.is_autotransitioning,
+         self.frames_remaining) = self._STRUCT.unpack(raw)
 
     def __repr__(self):
-        return '<downstream-keyer-state: dsk={}, onair={}, transitioning={} autotrans={} frames={}>'.format(self.index,
-                                                                                                            self.on_air,
-                                                                                                            self.is_transitioning,
-                                                                                                            self.is_autotransitioning,
-                                                                                                            self.frames_remaining)
+        return (f'<downstream-keyer-state: dsk={self.index}, onair={self.on_air}, '
+                f'transitioning={self.is_transitioning} autotrans={self.is_autotransitioning} '
+                f'frames={self.frames_remaining}>')
 
 
 class TransitionMixField(FieldBase):
@@ -1244,14 +1349,16 @@ class TransitionMixField(FieldBase):
     :ivar rate: Number of frames in the transition
     """
 
+    __slots__ = ('raw', 'index', 'rate')
     CODE = "TMxP"
+    _STRUCT = struct.Struct('>BBxx')
 
     def __init__(self, raw):
         self.raw = raw
-        self.index, self.rate = struct.unpack('>BBxx', raw)
+        self.index, self.rate = self._STRUCT.unpack(raw)
 
     def __repr__(self):
-        return '<transition-mix: me={}, rate={}>'.format(self.index, self.rate)
+        return f'<transition-mix: me={self.index}, rate={self.rate}>'
 
 
 class FadeToBlackField(FieldBase):
@@ -1272,14 +1379,16 @@ class FadeToBlackField(FieldBase):
     :ivar rate: Number of frames in transition
     """
 
+    __slots__ = ('raw', 'index', 'rate')
     CODE = "FtbP"
+    _STRUCT = struct.Struct('>BBxx')
 
     def __init__(self, raw):
         self.raw = raw
-        self.index, self.rate = struct.unpack('>BBxx', raw)
+        self.index, self.rate = self._STRUCT.unpack(raw)
 
     def __repr__(self):
-        return '<fade-to-black: me={}, rate={}>'.format(self.index, self.rate)
+        return f'<fade-to-black: me={self.index}, rate={self.rate}>'
 
 
 class TransitionDipField(FieldBase):
@@ -1301,14 +1410,16 @@ class TransitionDipField(FieldBase):
     :ivar source: Source index for the dip
     """
 
+    __slots__ = ('raw', 'index', 'rate', 'source')
     CODE = "TDpP"
+    _STRUCT = struct.Struct('>BBH')
 
     def __init__(self, raw):
         self.raw = raw
-        self.index, self.rate, self.source = struct.unpack('>BBH', raw)
+        self.index, self.rate, self.source = self._STRUCT.unpack(raw)
 
     def __repr__(self):
-        return '<transition-dip: me={}, rate={} source={}>'.format(self.index, self.rate, self.source)
+        return f'<transition-dip: me={self.index}, rate={self.rate} source={self.source}>'
 
 
 class TransitionWipeField(FieldBase):
@@ -1339,25 +1450,18 @@ class TransitionWipeField(FieldBase):
     :ivar source: Source index for the dip
     """
 
+    __slots__ = ('raw', 'index', 'rate', 'pattern', 'width', 'source', 'symmetry', 'softness', 'positionx', 'positiony',
+                 'reverse', 'flipflop')
     CODE = "TWpP"
+    _STRUCT = struct.Struct('>BBBx 6H 2? 2x')
 
     def __init__(self, raw):
         self.raw = raw
-        field = struct.unpack('>BBBx 6H 2? 2x', raw)
-        self.index = field[0]
-        self.rate = field[1]
-        self.pattern = field[2]
-        self.width = field[3]
-        self.source = field[4]
-        self.symmetry = field[5]
-        self.softness = field[6]
-        self.positionx = field[7]
-        self.positiony = field[8]
-        self.reverse = field[9]
-        self.flipflop = field[10]
+        (self.index, self.rate, self.pattern, self.width, self.source, self.symmetry, self.softness, self.positionx,
+         self.positiony, self.reverse, self.flipflop) = self._STRUCT.unpack(raw)
 
     def __repr__(self):
-        return '<transition-wipe: me={}, rate={} pattern={}>'.format(self.index, self.rate, self.pattern)
+        return f'<transition-wipe: me={self.index}, rate={self.rate} pattern={self.pattern}>'
 
 
 class TransitionDveField(FieldBase):
@@ -1398,26 +1502,18 @@ class TransitionDveField(FieldBase):
     :ivar flipflop: Flip flop transition
     """
 
+    __slots__ = ('raw', 'index', 'rate', 'style', 'fill_source', 'key_source', 'key_enable', 'key_premultiplied',
+                 'key_clip', 'key_gain', 'key_invert', 'reverse', 'flipflop')
     CODE = "TDvP"
+    _STRUCT = struct.Struct('>BBx B 2H 2? 2H 3? 3x')
 
     def __init__(self, raw):
         self.raw = raw
-        field = struct.unpack('>BBx B 2H 2? 2H 3? 3x', raw)
-        self.index = field[0]
-        self.rate = field[1]
-        self.style = field[2]
-        self.fill_source = field[3]
-        self.key_source = field[4]
-        self.key_enable = field[5]
-        self.key_premultiplied = field[6]
-        self.key_clip = field[7]
-        self.key_gain = field[8]
-        self.key_invert = field[9]
-        self.reverse = field[10]
-        self.flipflop = field[11]
+        (self.index, self.rate, self.style, self.fill_source, self.key_source, self.key_enable, self.key_premultiplied,
+         self.key_clip, self.key_gain, self.key_invert, self.reverse, self.flipflop) = self._STRUCT.unpack(raw)
 
     def __repr__(self):
-        return '<transition-dve: me={}, rate={} style={}>'.format(self.index, self.rate, self.style)
+        return f'<transition-dve: me={self.index}, rate={self.rate} style={self.style}>'
 
 
 class AudioMixerMasterPropertiesField(FieldBase):
@@ -1438,16 +1534,16 @@ class AudioMixerMasterPropertiesField(FieldBase):
     :ivar afv: Wether the master volume follows the fade-to-bloack
     """
 
+    __slots__ = ('raw', 'volume', 'afv')
     CODE = "AMMO"
+    _STRUCT = struct.Struct('>H 2x ?x 2x')
 
     def __init__(self, raw):
         self.raw = raw
-        field = struct.unpack('>H 2x ?x 2x', raw)
-        self.volume = field[0]
-        self.afv = field[1]
+        self.volume, self.afv = self._STRUCT.unpack(raw)
 
     def __repr__(self):
-        return '<audio-master-properties: volume={} afv={}>'.format(self.volume, self.afv)
+        return f'<audio-master-properties: volume={self.volume} afv={self.afv}>'
 
 
 class AudioMixerMonitorPropertiesField(FieldBase):
@@ -1471,21 +1567,17 @@ class AudioMixerMonitorPropertiesField(FieldBase):
     :ivar volume: Master volume for the mixer, unsigned int which maps [? - ?] to +10dB - -100dB (inf)
     """
 
+    __slots__ = ('raw', 'enabled', 'volume', 'mute', 'solo', 'solo_source', 'dim', 'dim_volume')
     CODE = "AMmO"
+    _STRUCT = struct.Struct('>?xH? ?H ?x H')
 
     def __init__(self, raw):
         self.raw = raw
-        field = struct.unpack('>?xH? ?H ?x H', raw)
-        self.enabled = field[0]
-        self.volume = field[1]
-        self.mute = field[2]
-        self.solo = field[3]
-        self.solo_source = field[4]
-        self.dim = field[5]
-        self.dim_volume = field[6]
+        (self.enabled, self.volume, self.mute, self.solo, self.solo_source, self.dim,
+         self.dim_volume) = self._STRUCT.unpack(raw)
 
     def __repr__(self):
-        return '<audio-monitor-properties: volume={}>'.format(self.volume)
+        return f'<audio-monitor-properties: volume={self.volume}>'
 
 
 class AudioMixerInputPropertiesField(FieldBase):
@@ -1512,24 +1604,19 @@ class AudioMixerInputPropertiesField(FieldBase):
     :ivar afv: Enable/disabled state for master audio-follow-video (for fade-to-black)
     """
 
+    __slots__ = ('raw', 'index', 'type', 'is_media_player', 'number', 'mix_option', 'volume', 'balance', 'strip_id')
     CODE = "AMIP"
+    _STRUCT = struct.Struct('>H B 2x ? B B x H h x x x')
 
     def __init__(self, raw):
         self.raw = raw
-        field = struct.unpack('>H B 2x ? B B x H h x x x', raw)
-        self.index = field[0]
-        self.type = field[1]
-        self.is_media_player = field[2]
-        self.number = field[3]
-        self.mix_option = field[4]
-        self.volume = field[5]
-        self.balance = field[6]
+        (self.index, self.type, self.is_media_player, self.number, self.mix_option, self.volume,
+         self.balance) = self._STRUCT.unpack(raw)
 
-        self.strip_id = str(self.index) + '.0'
+        self.strip_id = _strip_id(self.index)
 
     def __repr__(self):
-        return '<audio-mixer-input-properties: index={} volume={} balance={} >'.format(self.strip_id, self.volume,
-                                                                                       self.balance)
+        return f'<audio-mixer-input-properties: index={self.strip_id} volume={self.volume} balance={self.balance} >'
 
 
 class AudioMixerTallyField(FieldBase):
@@ -1545,22 +1632,21 @@ class AudioMixerTallyField(FieldBase):
     ====== ==== ====== ===========
     """
 
+    __slots__ = ('raw', 'num', 'tally')
     CODE = "AMTl"
+    _TALLY_STRUCT = struct.Struct('>H?')
 
     def __init__(self, raw):
         self.raw = raw
-        offset = 0
-        self.num, = struct.unpack_from('>H', raw, offset)
-        self.tally = {}
-        offset += 2
-        for i in range(0, self.num):
-            source, tally, = struct.unpack_from('>H?', raw, offset)
-            strip_id = '{}.{}'.format(source, 0)
-            self.tally[strip_id] = tally
-            offset += 3
+        self.num, = _COUNT.unpack_from(raw, 0)
+        end = 2 + (self.num * 3)
+        if len(raw) < end:
+            raise struct.error('AMTl field is too short for {} tally lights'.format(self.num))
+        entries = self._TALLY_STRUCT.iter_unpack(memoryview(raw)[2:end])
+        self.tally = {_strip_id(source): tally for source, tally in entries}
 
     def __repr__(self):
-        return '<audio-mixer-tally {}>'.format(self.tally)
+        return f'<audio-mixer-tally {self.tally}>'
 
 
 class FairlightMasterPropertiesField(FieldBase):
@@ -1589,20 +1675,16 @@ class FairlightMasterPropertiesField(FieldBase):
     :ivar afv: Enable/disabled state for master audio-follow-video (for fade-to-black)
     """
 
+    __slots__ = ('raw', 'eq_enable', 'eq_gain', 'dynamics_gain', 'volume', 'afv')
     CODE = "FAMP"
+    _STRUCT = struct.Struct('>x ? 4x h 2x H i ? 3x')
 
     def __init__(self, raw):
         self.raw = raw
-        field = struct.unpack('>x ? 4x h 2x H i ? 3x', raw)
-        self.eq_enable = field[0]
-        self.eq_gain = field[1]
-        self.dynamics_gain = field[2]
-        self.volume = field[3]
-        self.afv = field[4]
+        self.eq_enable, self.eq_gain, self.dynamics_gain, self.volume, self.afv = self._STRUCT.unpack(raw)
 
     def __repr__(self):
-        return '<fairlight-master-properties: volume={} make-up={} eq={}>'.format(self.volume, self.dynamics_gain,
-                                                                                  self.eq_gain)
+        return f'<fairlight-master-properties: volume={self.volume} make-up={self.dynamics_gain} eq={self.eq_gain}>'
 
 
 class FairlightStripPropertiesField(FieldBase):
@@ -1636,40 +1718,25 @@ class FairlightStripPropertiesField(FieldBase):
     :ivar afv: Enable/disabled state for master audio-follow-video (for fade-to-black)
     """
 
+    __slots__ = ('raw', 'index', 'is_split', 'subchannel', 'delay', 'gain', 'eq_enable', 'eq_gain', 'dynamics_gain',
+                 'pan', 'volume', 'state', 'strip_id')
     CODE = "FASP"
+    _STRUCT = struct.Struct('>H 12xBBxB 4x h 5x ? 4x h 2x Hh 4x h x B 2x')
 
     def __init__(self, raw):
         self.raw = raw
-        field = struct.unpack('>H 12xBBxB 4x h 5x ? 4x h 2x Hh 4x h x B 2x', raw)
-        self.index = field[0]
-        self.is_split = field[1]
-        self.subchannel = field[2]
-        self.delay = field[3]
-        self.gain = field[4]
-        self.eq_enable = field[5]
-        self.eq_gain = field[6]
-        self.dynamics_gain = field[7]
-        self.pan = field[8]
-        self.volume = field[9]
-        self.state = field[10]
+        (self.index, self.is_split, self.subchannel, self.delay, self.gain, self.eq_enable, self.eq_gain,
+         self.dynamics_gain, self.pan, self.volume, self.state) = self._STRUCT.unpack(raw)
 
-        self.strip_id = str(self.index)
-        if self.is_split == 0xff:
-            self.strip_id += '.' + str(self.subchannel)
-        else:
-            self.strip_id += '.0'
+        self.strip_id = _strip_id(self.index, self.subchannel if self.is_split == 0xff else 0)
 
     def __repr__(self):
         extra = ''
         if self.eq_enable:
             extra += ' EQ {}'.format(self.eq_gain)
 
-        return '<fairlight-strip-properties: index={} gain={} volume={} pan={} dgn={} {}>'.format(self.strip_id,
-                                                                                                  self.gain,
-                                                                                                  self.volume,
-                                                                                                  self.pan,
-                                                                                                  self.dynamics_gain,
-                                                                                                  extra)
+        return (f'<fairlight-strip-properties: index={self.strip_id} gain={self.gain} volume={self.volume} '
+                f'pan={self.pan} dgn={self.dynamics_gain} {extra}>')
 
 
 class FairlightStripDeleteField(FieldBase):
@@ -1679,13 +1746,14 @@ class FairlightStripDeleteField(FieldBase):
 
     """
 
+    __slots__ = ('raw',)
     CODE = "FASD"
 
     def __init__(self, raw):
         self.raw = raw
 
     def __repr__(self):
-        return '<fairlight-strip-delete {}>'.format(self.raw)
+        return f'<fairlight-strip-delete {self.raw}>'
 
 
 class FairlightAudioInputField(FieldBase):
@@ -1715,14 +1783,16 @@ class FairlightAudioInputField(FieldBase):
     :ivar volume: Master volume for the mixer, signed int which maps [-10000 - 1000] to +10dB - -100dB (inf)
     """
 
+    __slots__ = ('raw', 'index', 'type', 'number', 'split', 'level')
     CODE = "FAIP"
+    _STRUCT = struct.Struct('>HB 2x B xxxx B x B 3x')
 
     def __init__(self, raw):
         self.raw = raw
-        self.index, self.type, self.number, self.split, self.level = struct.unpack('>HB 2x B xxxx B x B 3x', raw)
+        self.index, self.type, self.number, self.split, self.level = self._STRUCT.unpack(raw)
 
     def __repr__(self):
-        return '<fairlight-input index={} type={}>'.format(self.index, self.type)
+        return f'<fairlight-input index={self.index} type={self.type}>'
 
 
 class FairlightTallyField(FieldBase):
@@ -1752,22 +1822,23 @@ class FairlightTallyField(FieldBase):
     :ivar volume: Master volume for the mixer, signed int which maps [-10000 - 1000] to +10dB - -100dB (inf)
     """
 
+    __slots__ = ('raw', 'num', 'tally')
     CODE = "FMTl"
+    # Entries are 11 bytes and only their first 4 bytes are known. The struct skips the 7 unknown bytes in front of
+    # an entry (the end of the header or of the previous entry) so the last entry doesn't need its trailing bytes.
+    _TALLY_STRUCT = struct.Struct('>7x BH?')
 
     def __init__(self, raw):
         self.raw = raw
-        offset = 0
-        self.num, = struct.unpack_from('>H', raw, offset)
-        self.tally = {}
-        offset += 15
-        for i in range(0, self.num):
-            subchan, source, tally, = struct.unpack_from('>BH?', raw, offset)
-            strip_id = '{}.{}'.format(source, subchan)
-            self.tally[strip_id] = tally
-            offset += 11
+        self.num, = _COUNT.unpack_from(raw, 0)
+        end = 8 + (self.num * self._TALLY_STRUCT.size)
+        if self.num and len(raw) < end:
+            raise struct.error('FMTl field is too short for {} tally lights'.format(self.num))
+        entries = self._TALLY_STRUCT.iter_unpack(memoryview(raw)[8:end])
+        self.tally = {_strip_id(source, subchan): tally for subchan, source, tally in entries}
 
     def __repr__(self):
-        return '<fairlight-tally {}>'.format(self.tally)
+        return f'<fairlight-tally {self.tally}>'
 
 
 class FairlightHeadphonesField(FieldBase):
@@ -1787,12 +1858,15 @@ class FairlightHeadphonesField(FieldBase):
 
     """
 
+    __slots__ = ('raw', 'volume', 'unmuted')
+    _STRUCT = struct.Struct('> i 4x ? 23x')
+
     def __init__(self, raw):
         self.raw = raw
-        self.volume, self.unmuted = struct.unpack('> i 4x ? 23x', raw)
+        self.volume, self.unmuted = self._STRUCT.unpack(raw)
 
     def __repr__(self):
-        return '<fairlight-headphones volume={} unmuted={}>'.format(self.volume, self.unmuted)
+        return f'<fairlight-headphones volume={self.volume} unmuted={self.unmuted}>'
 
 
 class FairlightSoloField(FieldBase):
@@ -1812,15 +1886,16 @@ class FairlightSoloField(FieldBase):
 
     """
 
+    __slots__ = ('raw', 'solo', 'channel', 'is_split_lr', 'subchannel')
+    _STRUCT = struct.Struct('> ? 8x B 12x BB')
+
     def __init__(self, raw):
         self.raw = raw
-        self.solo, self.channel, self.is_split_lr, self.subchannel = struct.unpack('> ? 8x B 12x BB', raw)
+        self.solo, self.channel, self.is_split_lr, self.subchannel = self._STRUCT.unpack(raw)
 
     def __repr__(self):
-        return '<fairlight-solo active={} source={}>'.format(
-            self.solo,
-            self.channel if self.is_split_lr == 0x01 else '{}.{}'.format(self.channel, self.subchannel),
-        )
+        source = self.channel if self.is_split_lr == 0x01 else f'{self.channel}.{self.subchannel}'
+        return f'<fairlight-solo active={self.solo} source={source}>'
 
 
 class AtemEqBandPropertiesField(FieldBase):
@@ -1863,43 +1938,31 @@ class AtemEqBandPropertiesField(FieldBase):
     :ivar volume: Master volume for the mixer, signed int which maps [-10000 - 1000] to +10dB - -100dB (inf)
     """
 
+    __slots__ = ('raw', 'index', 'is_split', 'subchannel', 'band_index', 'band_enabled', 'band_possible_filters',
+                 'band_filter', 'band_freq_range', 'band_frequency', 'band_gain', 'band_q', 'strip_id')
     CODE = "AEBP"
+    _STRUCT = struct.Struct('>H 2x 4x 6x BB B ? B B x B 4x H i H 2x')
+    _FILTERS = {
+        0x01: 'low-shelf',
+        0x02: 'low-pass',
+        0x04: 'bell',
+        0x08: 'notch',
+        0x10: 'high-pass',
+        0x20: 'high-shelf'
+    }
 
     def __init__(self, raw):
         self.raw = raw
-        values = struct.unpack('>H 2x 4x 6x BB B ? B B x B 4x H i H 2x', raw)
-        self.index = values[0]
-        self.is_split = values[1]
-        self.subchannel = values[2]
-        self.band_index = values[3]
-        self.band_enabled = values[4]
-        self.band_possible_filters = values[5]
-        self.band_filter = values[6]
-        self.band_freq_range = values[7]
-        self.band_frequency = values[8]
-        self.band_gain = values[9]
-        self.band_q = values[10]
+        (self.index, self.is_split, self.subchannel, self.band_index, self.band_enabled, self.band_possible_filters,
+         self.band_filter, self.band_freq_range, self.band_frequency, self.band_gain,
+         self.band_q) = self._STRUCT.unpack(raw)
 
-        self.strip_id = str(self.index)
-        if self.is_split == 0xff:
-            self.strip_id += '.' + str(self.subchannel)
-        else:
-            self.strip_id += '.0'
+        self.strip_id = _strip_id(self.index, self.subchannel if self.is_split == 0xff else 0)
 
     def __repr__(self):
-        desc = ''
-        filters = {
-            0x01: 'low-shelf',
-            0x02: 'low-pass',
-            0x04: 'bell',
-            0x08: 'notch',
-            0x10: 'high-pass',
-            0x20: 'high-shelf'
-        }
-        if self.band_filter in filters:
-            desc += filters[self.band_filter]
-        else:
-            desc += 'filter ' + str(self.band_filter)
+        desc = self._FILTERS.get(self.band_filter)
+        if desc is None:
+            desc = 'filter ' + str(self.band_filter)
 
         if self.band_enabled:
             desc += '[on]'
@@ -1908,7 +1971,7 @@ class AtemEqBandPropertiesField(FieldBase):
         desc += ' freq ' + str(self.band_frequency)
         desc += ' gain ' + str(self.band_gain)
         desc += ' Q ' + str(self.band_q)
-        return '<atem-eq-band-properties {} band {} {}>'.format(self.strip_id, self.band_index, desc)
+        return f'<atem-eq-band-properties {self.strip_id} band {self.band_index} {desc}>'
 
 
 class AudioInputField(FieldBase):
@@ -1955,34 +2018,32 @@ class AudioInputField(FieldBase):
     :ivar volume: Master volume for the mixer, signed int which maps [-10000 - 1000] to +10dB - -100dB (inf)
     """
 
+    __slots__ = ('raw', 'index', 'type', 'number', 'plug', 'state', 'volume', 'balance', 'strip_id')
     CODE = "AMIP"
+    _STRUCT = struct.Struct('>HB 2x B x BB x Hh 2x')
+    _PLUGS = {
+        0: "Internal",
+        1: "SDI",
+        2: "HDMI",
+        3: "Component",
+        4: "Composite",
+        5: "SVideo",
+        32: "XLR",
+        64: "AES",
+        128: "RCA",
+    }
 
     def __init__(self, raw):
         self.raw = raw
-        self.index, self.type, self.number, self.plug, self.state, self.volume, self.balance = struct.unpack(
-            '>HB 2x B x BB x Hh 2x', raw)
-        self.strip_id = str(self.index) + '.0'
+        self.index, self.type, self.number, self.plug, self.state, self.volume, self.balance = self._STRUCT.unpack(raw)
+        self.strip_id = _strip_id(self.index)
 
     def plug_name(self):
         """Return the display name for the connector"""
-        lut = {
-            0: "Internal",
-            1: "SDI",
-            2: "HDMI",
-            3: "Component",
-            4: "Composite",
-            5: "SVideo",
-            32: "XLR",
-            64: "AES",
-            128: "RCA",
-        }
-        if self.plug in lut:
-            return lut[self.plug]
-        else:
-            return 'Analog'
+        return self._PLUGS.get(self.plug, 'Analog')
 
     def __repr__(self):
-        return '<audio-input index={} type={} plug={}>'.format(self.index, self.type, self.plug)
+        return f'<audio-input index={self.index} type={self.type} plug={self.plug}>'
 
 
 class KeyPropertiesBaseField(FieldBase):
@@ -1990,27 +2051,18 @@ class KeyPropertiesBaseField(FieldBase):
     Data from the `KeBP`. The upstream keyer base properties.
     """
 
+    __slots__ = ('raw', 'index', 'keyer', 'type', 'enabled', 'fly_enabled', 'fill_source', 'key_source', 'mask_enabled',
+                 'mask_top', 'mask_bottom', 'mask_left', 'mask_right')
     CODE = "KeBP"
+    _STRUCT = struct.Struct('>BBB Bx B HH ?x 4h')
 
     def __init__(self, raw):
         self.raw = raw
-        field = struct.unpack('>BBB Bx B HH ?x 4h', raw)
-        self.index = field[0]
-        self.keyer = field[1]
-        self.type = field[2]
-        self.enabled = field[3]
-        self.fly_enabled = field[4]
-        self.fill_source = field[5]
-        self.key_source = field[6]
-        self.mask_enabled = field[7]
-
-        self.mask_top = field[8]
-        self.mask_bottom = field[9]
-        self.mask_left = field[10]
-        self.mask_right = field[11]
+        (self.index, self.keyer, self.type, self.enabled, self.fly_enabled, self.fill_source, self.key_source,
+         self.mask_enabled, self.mask_top, self.mask_bottom, self.mask_left, self.mask_right) = self._STRUCT.unpack(raw)
 
     def __repr__(self):
-        return '<key-properties-base me={}, key={}, type={}>'.format(self.index, self.keyer, self.type)
+        return f'<key-properties-base me={self.index}, key={self.keyer}, type={self.type}>'
 
 
 class KeyPropertiesDveField(FieldBase):
@@ -2018,51 +2070,32 @@ class KeyPropertiesDveField(FieldBase):
     Data from the `KeDV`. The upstream keyer DVE-specific properties.
     """
 
+    __slots__ = ('raw', 'index', 'keyer', 'size_x', 'size_y', 'pos_x', 'pos_y', 'rotation', 'border_enabled',
+                 'shadow_enabled', 'border_bevel', 'border_outer_width', 'border_inner_width', 'border_outer_softness',
+                 'border_inner_softness', 'border_bevel_softness', 'border_bevel_position', 'border_opacity',
+                 'border_hue', 'border_saturation', 'border_luma', 'light_angle', 'light_altitude', 'mask_enabled',
+                 'mask_top', 'mask_bottom', 'mask_left', 'mask_right', 'rate')
     CODE = "KeDV"
+    _STRUCT = struct.Struct('>BBxx 5i ??Bx HH BBBBBx 4HB? 4hB 3x')
 
     def __init__(self, raw):
         self.raw = raw
-        field = struct.unpack('>BBxx 5i ??Bx HH BBBBBx 4HB? 4hB 3x', raw)
-        self.index = field[0]
-        self.keyer = field[1]
-
-        self.size_x = field[2]
-        self.size_y = field[3]
-        self.pos_x = field[4]
-        self.pos_y = field[5]
-        self.rotation = field[6]
-
-        self.border_enabled = field[7]
-        self.shadow_enabled = field[8]
-        self.border_bevel = field[9]
+        (self.index, self.keyer, self.size_x, self.size_y, self.pos_x, self.pos_y, self.rotation,
+         self.border_enabled, self.shadow_enabled, self.border_bevel, self.border_outer_width, self.border_inner_width,
+         self.border_outer_softness, self.border_inner_softness, self.border_bevel_softness,
+         self.border_bevel_position, self.border_opacity, hue, saturation, luma, self.light_angle,
+         self.light_altitude, self.mask_enabled, self.mask_top, self.mask_bottom, self.mask_left, self.mask_right,
+         self.rate) = self._STRUCT.unpack(raw)
 
-        self.border_outer_width = field[10]
-        self.border_inner_width = field[11]
-
-        self.border_outer_softness = field[12]
-        self.border_inner_softness = field[13]
-        self.border_bevel_softness = field[14]
-        self.border_bevel_position = field[15]
-        self.border_opacity = field[16]
-
-        self.border_hue = field[17] / 10.0
-        self.border_saturation = field[18] / 1000.0
-        self.border_luma = field[19] / 1000.0
-        self.light_angle = field[20]
-        self.light_altitude = field[21]
-        self.mask_enabled = field[22]
-
-        self.mask_top = field[23]
-        self.mask_bottom = field[24]
-        self.mask_left = field[25]
-        self.mask_right = field[26]
-        self.rate = field[27]
+        self.border_hue = hue / 10.0
+        self.border_saturation = saturation / 1000.0
+        self.border_luma = luma / 1000.0
 
     def get_border_color_rgb(self):
-        return colorsys.hls_to_rgb(self.border_hue / 360.0, self.border_luma, self.border_saturation)
+        return _hls_to_rgb(self.border_hue / 360.0, self.border_luma, self.border_saturation)
 
     def __repr__(self):
-        return '<key-properties-dve me={}, key={}>'.format(self.index, self.keyer)
+        return f'<key-properties-dve me={self.index}, key={self.keyer}>'
 
 
 class KeyPropertiesLumaField(FieldBase):
@@ -2070,21 +2103,16 @@ class KeyPropertiesLumaField(FieldBase):
     Data from the `KeLm`. The upstream keyer luma-specific properties.
     """
 
+    __slots__ = ('raw', 'index', 'keyer', 'premultiplied', 'clip', 'gain', 'key_inverted')
     CODE = "KeLm"
+    _STRUCT = struct.Struct('>BB?x HH ?3x')
 
     def __init__(self, raw):
         self.raw = raw
-        field = struct.unpack('>BB?x HH ?3x', raw)
-        self.index = field[0]
-        self.keyer = field[1]
-        self.premultiplied = field[2]
-
-        self.clip = field[3]
-        self.gain = field[4]
-        self.key_inverted = field[5]
+        self.index, self.keyer, self.premultiplied, self.clip, self.gain, self.key_inverted = self._STRUCT.unpack(raw)
 
     def __repr__(self):
-        return '<key-properties-luma me={}, key={}>'.format(self.index, self.keyer)
+        return f'<key-properties-luma me={self.index}, key={self.keyer}>'
 
 
 class KeyPropertiesAdvancedChromaField(FieldBase):
@@ -2092,30 +2120,19 @@ class KeyPropertiesAdvancedChromaField(FieldBase):
     Data from the `KACk` field. This contains the data about the settings in the upstream advanced chroma keyer.
     """
 
+    __slots__ = ('raw', 'index', 'keyer', 'foreground', 'background', 'key_edge', 'spill_suppress', 'flare_suppress',
+                 'brightness', 'contrast', 'saturation', 'red', 'green', 'blue')
     CODE = "KACk"
+    _STRUCT = struct.Struct('>BBH HH HH hhHhhh')
 
     def __init__(self, raw):
         self.raw = raw
-        field = struct.unpack('>BBH HH HH hhHhhh', raw)
-        self.index = field[0]
-        self.keyer = field[1]
-
-        self.foreground = field[2]
-        self.background = field[3]
-        self.key_edge = field[4]
-
-        self.spill_suppress = field[5]
-        self.flare_suppress = field[6]
-
-        self.brightness = field[7]
-        self.contrast = field[8]
-        self.saturation = field[9]
-        self.red = field[10]
-        self.green = field[11]
-        self.blue = field[12]
+        (self.index, self.keyer, self.foreground, self.background, self.key_edge, self.spill_suppress,
+         self.flare_suppress, self.brightness, self.contrast, self.saturation, self.red, self.green,
+         self.blue) = self._STRUCT.unpack(raw)
 
     def __repr__(self):
-        return '<key-properties-advanced-chroma me={}, key={}>'.format(self.index, self.keyer)
+        return f'<key-properties-advanced-chroma me={self.index}, key={self.keyer}>'
 
 
 class KeyPropertiesAdvancedChromaColorpickerField(FieldBase):
@@ -2123,35 +2140,34 @@ class KeyPropertiesAdvancedChromaColorpickerField(FieldBase):
     Data from the `KACC` field. This contains the data about the color picker in the upstream advanced chroma keyer.
     """
 
+    __slots__ = ('raw', 'index', 'keyer', 'cursor', 'preview', 'x', 'y', 'size', 'Y', 'Cb', 'Cr')
     CODE = "KACC"
+    _STRUCT = struct.Struct('>BB?? hhH HHH')
 
     def __init__(self, raw):
         self.raw = raw
-        field = struct.unpack('>BB?? hhH HHH', raw)
-        self.index = field[0]
-        self.keyer = field[1]
-        self.cursor = field[2]
-        self.preview = field[3]
-
-        self.x = field[4]
-        self.y = field[5]
-        self.size = field[6]
+        (self.index, self.keyer, self.cursor, self.preview, self.x, self.y, self.size,
+         y, cb, cr) = self._STRUCT.unpack(raw)
 
-        self.Y = (field[7] - 625) / 8544
-        self.Cb = (field[8] - 5000) / 5000
-        self.Cr = (field[9] - 5000) / 5000
+        self.Y = (y - 625) / 8544
+        self.Cb = (cb - 5000) / 5000
+        self.Cr = (cr - 5000) / 5000
 
     def get_rgb(self):
-        r = self.Y + (self.Cr * 1.5748)
-        g = self.Y + (self.Cb * -0.1873) + (self.Cr * -0.4681)
-        b = self.Y + (self.Cb * 1.8556)
-        r = max(0, min(1, r))
-        g = max(0, min(1, g))
-        b = max(0, min(1, b))
+        y = self.Y
+        cb = self.Cb
+        cr = self.Cr
+        r = y + (cr * 1.5748)
+        g = y + (cb * -0.1873) + (cr * -0.4681)
+        b = y + (cb * 1.8556)
+        # Clamp to [0, 1] with comparisons, min() and max() are 6 function calls per sample
+        r = 0 if r < 0 else 1 if r > 1 else r
+        g = 0 if g < 0 else 1 if g > 1 else g
+        b = 0 if b < 0 else 1 if b > 1 else b
         return r, g, b
 
     def __repr__(self):
-        return '<key-properties-advanced-chroma-colorpicker me={}, key={}>'.format(self.index, self.keyer)
+        return f'<key-properties-advanced-chroma-colorpicker me={self.index}, key={self.keyer}>'
 
 
 class RecordingDiskField(FieldBase):
@@ -2180,25 +2196,28 @@ class RecordingDiskField(FieldBase):
 
     """
 
+    __slots__ = ('raw', 'index', 'time_available', 'status', 'volumename', 'is_idle', 'is_unformatted', 'is_attached',
+                 'is_ready', 'is_recording', 'is_deleted')
     CODE = "RTMD"
+    _STRUCT = struct.Struct('>IIH 64s 2x')
 
     def __init__(self, raw):
         self.raw = raw
-        field = struct.unpack('>IIH 64s 2x', raw)
-        self.index = field[0]
-        self.time_available = field[1]
-        self.status = field[2]
-        self.volumename = self._get_string(field[3])
+        self.index, self.time_available, status, volumename = self._STRUCT.unpack(raw)
+        self.status = status
+        self.volumename = self._get_string(volumename)
 
-        self.is_attached = field[2] & 1 << 0 > 0
-        self.is_attached = field[2] & 1 << 1 > 0
-        self.is_ready = field[2] & 1 << 2 > 0
-        self.is_recording = field[2] & 1 << 3 > 0
-        self.is_deleted = field[2] & 1 << 5 > 0
+        self.is_idle = status & 0x01 != 0
+        self.is_unformatted = status & 0x02 != 0
+        # Kept for existing users, this always held the unformatted bit since it was assigned twice
+        self.is_attached = self.is_unformatted
+        self.is_ready = status & 0x04 != 0
+        self.is_recording = status & 0x08 != 0
+        self.is_deleted = status & 0x20 != 0
 
     def __repr__(self):
-        return '<recording-disk disk={} label={} status={} available={}>'.format(self.index, self.volumename,
-                                                                                 self.status, self.time_available)
+        return (f'<recording-disk disk={self.index} label={self.volumename} status={self.status} '
+                f'available={self.time_available}>')
 
 
 class RecordingSettingsField(FieldBase):
@@ -2219,20 +2238,20 @@ class RecordingSettingsField(FieldBase):
     it will be the disk number referring a RTMD field
     """
 
+    __slots__ = ('raw', 'filename', 'disk1', 'disk2', 'record_in_cameras')
     CODE = "RMSu"
+    _STRUCT = struct.Struct('>128s ii ?3x')
 
     def __init__(self, raw):
         self.raw = raw
-        field = struct.unpack('>128s ii ?3x', raw)
-        self.filename = self._get_string(field[0])
-        self.disk1 = field[1] if field[1] != -1 else None
-        self.disk2 = field[2] if field[2] != -1 else None
-        self.record_in_cameras = field[3]
+        filename, disk1, disk2, self.record_in_cameras = self._STRUCT.unpack(raw)
+        self.filename = self._get_string(filename)
+        self.disk1 = disk1 if disk1 != -1 else None
+        self.disk2 = disk2 if disk2 != -1 else None
 
     def __repr__(self):
-        return '<recording-settings filename={} disk1={} disk2={} in-camera={}>'.format(self.filename, self.disk1,
-                                                                                        self.disk2,
-                                                                                        self.record_in_cameras)
+        return (f'<recording-settings filename={self.filename} disk1={self.disk1} disk2={self.disk2} '
+                f'in-camera={self.record_in_cameras}>')
 
 
 class RecordingStatusField(FieldBase):
@@ -2261,23 +2280,26 @@ class RecordingStatusField(FieldBase):
 
     """
 
+    __slots__ = ('raw', 'status', 'time_available', 'is_recording', 'is_stopping', 'disk_full', 'disk_error',
+                 'disk_unformatted', 'has_dropped')
     CODE = "RMTS"
+    _STRUCT = struct.Struct('>H2xi')
 
     def __init__(self, raw):
         self.raw = raw
-        field = struct.unpack('>H2xi', raw)
-        self.status = field[0]
-        self.time_available = field[1] if field[1] != -1 else None
+        status, time_available = self._STRUCT.unpack(raw)
+        self.status = status
+        self.time_available = time_available if time_available != -1 else None
 
-        self.is_recording = field[0] & 1 << 0 > 0
-        self.is_stopping = field[0] & 1 << 7 > 0
-        self.disk_full = field[0] & 1 << 2 > 0
-        self.disk_error = field[0] & 1 << 3 > 0
-        self.disk_unformatted = field[0] & 1 << 4 > 0
-        self.has_dropped = field[0] & 1 << 5 > 0
+        self.is_recording = status & 0x01 != 0
+        self.is_stopping = status & 0x80 != 0
+        self.disk_full = status & 0x04 != 0
+        self.disk_error = status & 0x08 != 0
+        self.disk_unformatted = status & 0x10 != 0
+        self.has_dropped = status & 0x20 != 0
 
     def __repr__(self):
-        return '<recording-status status={} time-available={}>'.format(self.status, self.time_available)
+        return f'<recording-status status={self.status} time-available={self.time_available}>'
 
 
 class RecordingDurationField(FieldBase):
@@ -2299,22 +2321,19 @@ class RecordingDurationField(FieldBase):
 
     """
 
+    __slots__ = ('raw', 'hours', 'minutes', 'seconds', 'frames', 'has_dropped_frames')
     CODE = "RTMR"
+    _STRUCT = struct.Struct('>4B ?3x')
 
     def __init__(self, raw):
         self.raw = raw
-        field = struct.unpack('>4B ?3x', raw)
-        self.hours = field[0]
-        self.minutes = field[1]
-        self.seconds = field[2]
-        self.frames = field[3]
-        self.has_dropped_frames = field[4]
+        self.hours, self.minutes, self.seconds, self.frames, self.has_dropped_frames = self._STRUCT.unpack(raw)
 
     def __repr__(self):
         drop = ''
         if self.has_dropped_frames:
             drop = ' dropped-frames'
-        return '<recording-duration {}:{}:{}:{}{}>'.format(self.hours, self.minutes, self.seconds, self.frames, drop)
+        return f'<recording-duration {self.hours}:{self.minutes}:{self.seconds}:{self.frames}{drop}>'
 
 
 class MultiviewerPropertiesField(FieldBase):
@@ -2350,24 +2369,23 @@ class MultiviewerPropertiesField(FieldBase):
 
     """
 
+    __slots__ = ('raw', 'index', 'layout', 'flip', 'u1', 'top_left_small', 'top_right_small', 'bottom_left_small',
+                 'bottom_right_small')
     CODE = "MvPr"
+    _STRUCT = struct.Struct('>BB?B')
 
     def __init__(self, raw):
         self.raw = raw
-        field = struct.unpack('>BB?B', raw)
-        self.index = field[0]
-        self.layout = field[1]
-        self.flip = field[2]
-        self.u1 = field[3]
+        self.index, layout, self.flip, self.u1 = self._STRUCT.unpack(raw)
+        self.layout = layout
 
-        self.top_left_small = field[1] & 0x01 > 0
-        self.top_right_small = field[1] & 0x02 > 0
-        self.bottom_left_small = field[1] & 0x04 > 0
-        self.bottom_right_small = field[1] & 0x08 > 0
+        self.top_left_small = layout & 0x01 != 0
+        self.top_right_small = layout & 0x02 != 0
+        self.bottom_left_small = layout & 0x04 != 0
+        self.bottom_right_small = layout & 0x08 != 0
 
     def __repr__(self):
-        return '<multiviewer-properties mv={} layout={} flip={} u1={}>'.format(self.index, self.layout, self.flip,
-                                                                               self.u1)
+        return f'<multiviewer-properties mv={self.index} layout={self.layout} flip={self.flip} u1={self.u1}>'
 
 
 class MultiviewerInputField(FieldBase):
@@ -2425,14 +2443,16 @@ class MultiviewerInputField(FieldBase):
     :ivar safearea: True if safe area overlays can be enabled
     """
 
+    __slots__ = ('raw', 'index', 'window', 'source', 'vu', 'safearea')
     CODE = "MvIn"
+    _STRUCT = struct.Struct('>BBH??2x')
 
     def __init__(self, raw):
         self.raw = raw
-        self.index, self.window, self.source, self.vu, self.safearea = struct.unpack('>BBH??2x', raw)
+        self.index, self.window, self.source, self.vu, self.safearea = self._STRUCT.unpack(raw)
 
     def __repr__(self):
-        return '<multiviewer-input mv={} win={} source={}>'.format(self.index, self.window, self.source)
+        return f'<multiviewer-input mv={self.index} win={self.window} source={self.source}>'
 
 
 class MultiviewerVuField(FieldBase):
@@ -2454,14 +2474,16 @@ class MultiviewerVuField(FieldBase):
     :ivar enabled: True if the VU meter overlay is enabled for this window
     """
 
+    __slots__ = ('raw', 'index', 'window', 'enabled')
     CODE = "VuMC"
+    _STRUCT = struct.Struct('>BB?x')
 
     def __init__(self, raw):
         self.raw = raw
-        self.index, self.window, self.enabled = struct.unpack('>BB?x', raw)
+        self.index, self.window, self.enabled = self._STRUCT.unpack(raw)
 
     def __repr__(self):
-        return '<multiviewer-vu mv={} win={} enabled={}>'.format(self.index, self.window, self.enabled)
+        return f'<multiviewer-vu mv={self.index} win={self.window} enabled={self.enabled}>'
 
 
 class MultiviewerSafeAreaField(FieldBase):
@@ -2484,14 +2506,16 @@ class MultiviewerSafeAreaField(FieldBase):
     :ivar enabled: True if the safe area meter overlay is enabled for this window
     """
 
+    __slots__ = ('raw', 'index', 'window', 'enabled')
     CODE = "SaMw"
+    _STRUCT = struct.Struct('>BB?x')
 
     def __init__(self, raw):
         self.raw = raw
-        self.index, self.window, self.enabled = struct.unpack('>BB?x', raw)
+        self.index, self.window, self.enabled = self._STRUCT.unpack(raw)
 
     def __repr__(self):
-        return '<multiviewer-safe-area mv={} win={} enabled={}>'.format(self.index, self.window, self.enabled)
+        return f'<multiviewer-safe-area mv={self.index} win={self.window} enabled={self.enabled}>'
 
 
 class LockObtainedField(FieldBase):
@@ -2510,14 +2534,16 @@ class LockObtainedField(FieldBase):
     :ivar store: Store index
 =    """
 
+    __slots__ = ('raw', 'store')
     CODE = "LKOB"
+    _STRUCT = struct.Struct('>H2x')
 
     def __init__(self, raw):
         self.raw = raw
-        self.store, = struct.unpack('>H2x', raw)
+        self.store, = self._STRUCT.unpack(raw)
 
     def __repr__(self):
-        return '<lock-obtained store={}>'.format(self.store)
+        return f'<lock-obtained store={self.store}>'
 
 
 class LockStateField(FieldBase):
@@ -2537,15 +2563,17 @@ class LockStateField(FieldBase):
     :ivar state: True if a lock is held
     """
 
+    __slots__ = ('raw', 'store', 'state', 'u1')
     CODE = "LKST"
+    _STRUCT = struct.Struct('>H?B')
 
     def __init__(self, raw):
         self.raw = raw
-        self.store, self.state, self.u1 = struct.unpack('>H?B', raw)
+        self.store, self.state, self.u1 = self._STRUCT.unpack(raw)
 
     def __repr__(self):
         state = 'locked' if self.state else 'unlocked'
-        return '<lock-state store={} state={}>'.format(self.store, state)
+        return f'<lock-state store={self.store} state={state}>'
 
 
 class FileTransferDataField(FieldBase):
@@ -2560,21 +2588,28 @@ class FileTransferDataField(FieldBase):
     ?      ?    bytes  The rest of the packet contains [Data length] bytes of data
     ====== ==== ====== ===========
 
+    The chunk is not copied out of the packet, data is a memoryview into raw. It keeps the whole received packet alive
+    and it changes along with raw, so a receive buffer must not be reused while the field is in use. Take bytes(data)
+    to keep a chunk around, to hash it or to use bytes methods like decode() on it.
+
     After parsing:
     :ivar transfer: Transfer index
     :ivar size: Length of the transfer chunk
-    :ivar data: Contents of the transfer chunk
+    :ivar data: Contents of the transfer chunk, as a memoryview into raw
     """
 
+    __slots__ = ('raw', 'transfer', 'size', 'data')
     CODE = "FTDa"
+    _STRUCT = struct.Struct('>HH')
 
     def __init__(self, raw):
         self.raw = raw
-        self.transfer, self.size = struct.unpack('>HH', raw[0:4])
-        self.data = raw[4:(4 + self.size)]
+        self.transfer, self.size = self._STRUCT.unpack_from(raw, 0)
+        # A view instead of a copy, transfers arrive as a long stream of these chunks
+        self.data = memoryview(raw)[4:(4 + self.size)]
 
     def __repr__(self):
-        return '<file-transfer-data transfer={} size={}>'.format(self.transfer, self.size)
+        return f'<file-transfer-data transfer={self.transfer} size={self.size}>'
 
 
 class FileTransferErrorField(FieldBase):
@@ -2602,11 +2637,13 @@ class FileTransferErrorField(FieldBase):
     :ivar status: Status id from the enum above
     """
 
+    __slots__ = ('raw', 'transfer', 'status')
     CODE = "FTDE"
+    _STRUCT = struct.Struct('>HBx')
 
     def __init__(self, raw):
         self.raw = raw
-        self.transfer, self.status = struct.unpack('>HBx', raw)
+        self.transfer, self.status = self._STRUCT.unpack(raw)
 
     def __repr__(self):
         errors = {
@@ -2619,7 +2656,7 @@ class FileTransferErrorField(FieldBase):
             status = errors[self.status]
         else:
             status = f'unknown ({self.status})'
-        return '<file-transfer-error transfer={} status={}>'.format(self.transfer, status)
+        return f'<file-transfer-error transfer={self.transfer} status={status}>'
 
 
 class FileTransferDataCompleteField(FieldBase):
@@ -2638,14 +2675,16 @@ class FileTransferDataCompleteField(FieldBase):
     :ivar transfer: Transfer index that has completed
     """
 
+    __slots__ = ('raw', 'transfer', 'u1', 'u2')
     CODE = "FTDC"
+    _STRUCT = struct.Struct('>HBB')
 
     def __init__(self, raw):
         self.raw = raw
-        self.transfer, self.u1, self.u2 = struct.unpack('>HBB', raw)
+        self.transfer, self.u1, self.u2 = self._STRUCT.unpack(raw)
 
     def __repr__(self):
-        return '<file-transfer-complete transfer={} u1={} u2={}>'.format(self.transfer, self.u1, self.u2)
+        return f'<file-transfer-complete transfer={self.transfer} u1={self.u1} u2={self.u2}>'
 
 
 class FileTransferContinueDataField(FieldBase):
@@ -2669,14 +2708,16 @@ class FileTransferContinueDataField(FieldBase):
     :ivar count: Contents of the transfer chunk
     """
 
+    __slots__ = ('raw', 'transfer', 'size', 'count')
     CODE = "FTCD"
+    _STRUCT = struct.Struct('>H 4x HH 2x')
 
     def __init__(self, raw):
         self.raw = raw
-        self.transfer, self.size, self.count = struct.unpack('>H 4x HH 2x', raw)
+        self.transfer, self.size, self.count = self._STRUCT.unpack(raw)
 
     def __repr__(self):
-        return '<file-transfer-continue transfer={} size={} count={}>'.format(self.transfer, self.size, self.count)
+        return f'<file-transfer-continue transfer={self.transfer} size={self.size} count={self.count}>'
 
 
 class MacroPropertiesField(FieldBase):
@@ -2704,21 +2745,22 @@ class MacroPropertiesField(FieldBase):
     :ivar description: Description of the macro
     """
 
+    __slots__ = ('raw', 'index', 'is_used', 'is_invalid', 'name', 'description')
     CODE = "MPrp"
+    _STRUCT = struct.Struct('>H ?? H H')
 
     def __init__(self, raw):
         self.raw = raw
-        field = struct.unpack_from('>H ?? H H', raw, 0)
-        self.index = field[0]
-        self.is_used = field[1]
-        self.is_invalid = field[2]
-        name_length = field[3]
-        desc_length = field[4]
-        self.name, self.description = struct.unpack_from('>{}s {}s'.format(name_length, desc_length), raw, 8)
+        self.index, self.is_used, self.is_invalid, name_length, desc_length = self._STRUCT.unpack_from(raw, 0)
+        name_end = 8 + name_length
+        desc_end = name_end + desc_length
+        if len(raw) < desc_end:
+            raise struct.error('MPrp field is too short for its name and description')
+        self.name = raw[8:name_end]
+        self.description = raw[name_end:desc_end]
 
     def __repr__(self):
-        return '<macro-properties: index={} used={} name={}>'.format(self.index, self.is_used,
-                                                                     self.name)
+        return f'<macro-properties: index={self.index} used={self.is_used} name={self.name}>'
 
 
 class AudioMeterLevelsField(FieldBase):
@@ -2753,37 +2795,30 @@ class AudioMeterLevelsField(FieldBase):
     :ivar input: All input levels as a dict, the key is the channel number and the value a level tuple
     """
 
+    __slots__ = ('raw', 'count', 'master', 'monitor', 'input')
     CODE = "AMLv"
+    _STRUCT = struct.Struct('>H2x 4I 4I')
+    _SOURCE_STRUCT = struct.Struct('>H')
+    _LEVELS_STRUCT = struct.Struct('>4I')
 
     def __init__(self, raw):
         self.raw = raw
-        field = struct.unpack_from('>H2x 4I 4I', raw, 0)
+        level = self._level
+        field = self._STRUCT.unpack_from(raw, 0)
         self.count = field[0]
-        self.master = (
-            self._level(field[1]),
-            self._level(field[2]),
-            self._level(field[3]),
-            self._level(field[4])
-        )
-        self.monitor = (
-            self._level(field[5]),
-            self._level(field[6]),
-            self._level(field[7]),
-            self._level(field[8])
-        )
-        self.input = {}
-        offset = struct.calcsize('>H2x 4I 4I')
-        sources = struct.unpack_from('>{}H'.format(self.count), raw, offset)
-        offset = int(math.ceil((offset + (2 * self.count)) / 4.0) * 4)
-        field = struct.unpack_from('>{}I'.format(self.count * 4), raw, offset)
-        for i in range(0, self.count * 4, 4):
-            level = (
-                self._level(field[i]),
-                self._level(field[i + 1]),
-                self._level(field[i + 2]),
-                self._level(field[i + 3])
-            )
-            self.input[sources[i // 4]] = level
+        self.master = tuple(map(level, field[1:5]))
+        self.monitor = tuple(map(level, field[5:9]))
+
+        start = self._STRUCT.size
+        # The source list is padded to a multiple of 4 bytes before the levels start
+        offset = (start + 2 * self.count + 3) & ~3
+        end = offset + self._LEVELS_STRUCT.size * self.count
+        if self.count and len(raw) < end:
+            raise struct.error('AMLv field is too short for {} channels'.format(self.count))
+        view = memoryview(raw)
+        sources = self._SOURCE_STRUCT.iter_unpack(view[start:start + 2 * self.count])
+        levels = self._LEVELS_STRUCT.iter_unpack(view[offset:end])
+        self.input = {source: tuple(map(level, values)) for (source,), values in zip(sources, levels)}
 
     def _level(self, value):
         if value == 0:
@@ -2792,7 +2827,7 @@ class AudioMeterLevelsField(FieldBase):
         return val
 
     def __repr__(self):
-        return '<audio-meter-levels count={}>'.format(self.count)
+        return f'<audio-meter-levels count={self.count}>'
 
 
 class FairlightMeterLevelsField(FieldBase):
@@ -2837,55 +2872,28 @@ class FairlightMeterLevelsField(FieldBase):
     :ivar limiter_gr: Gain reduction by the limiter
     """
 
+    __slots__ = ('raw', 'index', 'is_split', 'subchannel', 'strip_id', 'input', 'expander_gr', 'compressor_gr',
+                 'limiter_gr', 'output', 'level')
     CODE = "FMLv"
-    COEFF = 10 ** (40 / 20)
+    _STRUCT = struct.Struct('>6xBBH 15h')
+    COEFF = _FAIRLIGHT_COEFF
 
     def __init__(self, raw):
         self.raw = raw
-        field = struct.unpack_from('>6xBBH 15h', raw, 0)
-        self.index = field[2]
-        self.is_split = field[0]
-        self.subchannel = field[1]
+        level = _fairlight_level
+        field = self._STRUCT.unpack_from(raw, 0)
+        self.is_split, self.subchannel, self.index = field[0:3]
 
-        if self.is_split == 0xff:
-            self.strip_id = f"{self.index}.{self.subchannel}"
-        else:
-            self.strip_id = f"{self.index}.0"
-
-        self.input = (
-            self._level(field[3]),
-            self._level(field[4]),
-            self._level(field[5]),
-            self._level(field[6])
-        )
-
-        self.expander_gr = self._level(field[7])
-        self.compressor_gr = self._level(field[8])
-        self.limiter_gr = self._level(field[9])
-
-        self.output = (
-            self._level(field[10]),
-            self._level(field[11]),
-            self._level(field[12]),
-            self._level(field[13])
-        )
-        self.level = (
-            self._level(field[14]),
-            self._level(field[15]),
-            self._level(field[16]),
-            self._level(field[17])
-        )
+        self.strip_id = _strip_id(self.index, self.subchannel if self.is_split == 0xff else 0)
 
-    def _level(self, value):
-        if value == 0:
-            return 0
-        value += 10000
-        value /= 10000
-        if value == 0:
-            return -60
-        val = (math.exp((math.log(self.COEFF + 1) * value)) - 1) / self.COEFF
-        val = val * 60 - 60
-        return val
+        self.input = tuple(map(level, field[3:7]))
+
+        self.expander_gr = level(field[7])
+        self.compressor_gr = level(field[8])
+        self.limiter_gr = level(field[9])
+
+        self.output = tuple(map(level, field[10:14]))
+        self.level = tuple(map(level, field[14:18]))
 
     def __repr__(self):
         return '<fairlight-meter-levels source={}>'.format(self.strip_id)
@@ -2922,46 +2930,23 @@ class FairlightMasterLevelsField(FieldBase):
     :ivar limiter_gr: Gain reduction by the limiter
     """
 
+    __slots__ = ('raw', 'input', 'compressor_gr', 'limiter_gr', 'output', 'level')
     CODE = "FDLv"
-    COEFF = 10 ** (40 / 20)
+    _STRUCT = struct.Struct('>14h')
+    COEFF = _FAIRLIGHT_COEFF
 
     def __init__(self, raw):
         self.raw = raw
-        field = struct.unpack_from('>14h', raw, 0)
-
-        self.input = (
-            self._level(field[0]),
-            self._level(field[1]),
-            self._level(field[2]),
-            self._level(field[3])
-        )
+        level = _fairlight_level
+        field = self._STRUCT.unpack_from(raw, 0)
 
-        self.compressor_gr = self._level(field[4])
-        self.limiter_gr = self._level(field[5])
+        self.input = tuple(map(level, field[0:4]))
 
-        self.output = (
-            self._level(field[6]),
-            self._level(field[7]),
-            self._level(field[8]),
-            self._level(field[9])
-        )
-        self.level = (
-            self._level(field[10]),
-            self._level(field[11]),
-            self._level(field[12]),
-            self._level(field[13])
-        )
+        self.compressor_gr = level(field[4])
+        self.limiter_gr = level(field[5])
 
-    def _level(self, value):
-        if value == 0:
-            return 0
-        value += 10000
-        value /= 10000
-        if value == 0:
-            return -60
-        val = (math.exp((math.log(self.COEFF + 1) * value)) - 1) / self.COEFF
-        val = val * 60 - 60
-        return val
+        self.output = tuple(map(level, field[6:10]))
+        self.level = tuple(map(level, field[10:14]))
 
     def __repr__(self):
         return '<fairlight-master-levels>'
@@ -3078,52 +3063,51 @@ class CameraControlDataPacketFieldDisabled(FieldBase):
     :ivar data: Data attached to the command
     """
 
+    __slots__ = ('raw', 'destination', 'category', 'parameter', 'datatype', 'length', 'data')
     CODE = "CCdP"
-
-    def __init__(self, raw):
-        self.raw = raw
-        self.destination, self.category, self.parameter, self.datatype, *weird = struct.unpack_from('>4B 4B 4B', raw, 0)
-
-        num_elements = sum(weird)
-        num_overrides = {
-            (0, 0): 1,
-            (0, 1): 0,
-            (0, 2): 1,
-            (0, 3): 1.,
-            (0, 4): 1,
-            (0, 6): 1,
-            (1, 2): 2
-        }
-        if (self.category, self.parameter) in num_overrides:
-            num_elements = num_overrides[(self.category, self.parameter)]
+    # The 8 element count bytes are only read when there's no override, the padding still enforces the header length
+    _STRUCT = struct.Struct('>4B 8x')
+    # Element counts for (category, parameter) pairs where the header count is wrong
+    _NUM_OVERRIDES = {
+        (0, 0): 1,
+        (0, 1): 0,
+        (0, 2): 1,
+        (0, 3): 1,
+        (0, 4): 1,
+        (0, 6): 1,
+        (1, 2): 2
+    }
+    # Struct format character for each element datatype, UTF-8 (5) and unknown types are not unpacked
+    _TYPE_CHARS = {
+        0: '?',  # Boolean
+        1: 'b',  # Signed byte
+        2: 'h',  # Signed short
+        3: 'i',  # Signed int
+        4: 'q',  # Signed long
+        128: 'h',  # Fixed 16
+    }
+    # Fixed 16 values have 11 fractional bits, scaling by a power of two is exact so multiplying is the same as dividing
+    _FIXED16_SCALE = 1 / (2 ** 11)
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.destination, self.category, self.parameter, self.datatype = self._STRUCT.unpack_from(raw, 0)
+
+        num_elements = self._NUM_OVERRIDES.get((self.category, self.parameter))
+        if num_elements is None:
+            num_elements = sum(raw[4:12])
         self.length = num_elements
 
         self.data = None
         if len(raw) > 16:
-            dfmt = '>'
-            if self.datatype == 0:  # Boolean
-                dfmt += '?' * num_elements
-            elif self.datatype == 1:  # Signed byte
-                dfmt += 'b' * num_elements
-            elif self.datatype == 2:  # Signed short
-                dfmt += 'h' * num_elements
-            elif self.datatype == 3:  # Signed int
-                dfmt += 'i' * num_elements
-            elif self.datatype == 4:  # Signed long
-                dfmt += 'q' * num_elements
-            elif self.datatype == 5:  # UTF-8
-                pass
-            elif self.datatype == 128:  # Fixed 16
-                dfmt += 'h' * num_elements
-            self.data = struct.unpack_from(dfmt, raw, 16)
+            data_struct = _camera_data_struct(self._TYPE_CHARS.get(self.datatype, ''), num_elements)
+            self.data = data_struct.unpack_from(raw, 16)
             if self.datatype == 128:
                 self.data = self.unpack_fixed16(self.data)
 
     def unpack_fixed16(self, raw):
-        result = []
-        for f16 in raw:
-            result.append(f16 / (2 ** 11))
-        return result
+        scale = self._FIXED16_SCALE
+        return [f16 * scale for f16 in raw]
 
     def __repr__(self):
         return '<camera-control-data-packet dest={} command={}.{} type={} data={}>'.format(self.destination,
@@ -3147,11 +3131,13 @@ class StreamingAudioBitrateField(FieldBase):
 
     """
 
+    __slots__ = ('raw', 'min', 'max')
     CODE = "STAB"
+    _STRUCT = struct.Struct('>II')
 
     def __init__(self, raw):
         self.raw = raw
-        self.min, self.max = struct.unpack('>II', raw)
+        self.min, self.max = self._STRUCT.unpack(raw)
 
     def __repr__(self):
         return '<streaming-audio-bitrate min={} max={}>'.format(self.min, self.max)
@@ -3177,11 +3163,13 @@ class StreamingServiceField(FieldBase):
 
     """
 
+    __slots__ = ('raw', 'name', 'url', 'key', 'min', 'max')
     CODE = "SRSU"
+    _STRUCT = struct.Struct('>64s512s512sII')
 
     def __init__(self, raw):
         self.raw = raw
-        field = struct.unpack_from('>64s512s512sII', raw, 0)
+        field = self._STRUCT.unpack_from(raw, 0)
         self.name = self._get_string(field[0])
         self.url = self._get_string(field[1])
         self.key = self._get_string(field[2])
@@ -3217,11 +3205,13 @@ class StreamingStatusField(FieldBase):
     ====== =====
     """
 
+    __slots__ = ('raw', 'status')
     CODE = "StRS"
+    _STRUCT = struct.Struct('>h 2x')
 
     def __init__(self, raw):
         self.raw = raw
-        self.status, = struct.unpack('>h 2x', raw)
+        self.status, = self._STRUCT.unpack(raw)
 
     def __repr__(self):
         return '<streaming-status status={}>'.format(self.status)
@@ -3240,11 +3230,13 @@ class StreamingStatsField(FieldBase):
 
     """
 
+    __slots__ = ('raw', 'bitrate', 'cache')
     CODE = "SRSS"
+    _STRUCT = struct.Struct('>IHxx')
 
     def __init__(self, raw):
         self.raw = raw
-        self.bitrate, self.cache = struct.unpack('>IHxx', raw)
+        self.bitrate, self.cache = self._STRUCT.unpack(raw)
 
     def __repr__(self):
         return '<streaming-stats bitrate={} cache={}>'.format(self.bitrate, self.cache)
@@ -3269,11 +3261,13 @@ class AutoInputVideoModeField(FieldBase):
     :ivar detected: A video mode has been detected from an input
     """
 
+    __slots__ = ('raw', 'enabled', 'detected')
     CODE = "AiVM"
+    _STRUCT = struct.Struct('>??2x')
 
     def __init__(self, raw):
         self.raw = raw
-        self.enabled, self.detected = struct.unpack('>??2x', raw)
+        self.enabled, self.detected = self._STRUCT.unpack(raw)
 
     def __repr__(self):
         return '<auto-input-video-mode: enabled={} detected={}>'.format(self.enabled, self.detected)
@@ -3290,6 +3284,7 @@ class InitCompleteField(FieldBase):
     ====== ==== ====== ===========
     """
 
+    __slots__ = ('raw',)
     CODE = "InCm"
 
     def __init__(self, raw):
@@ -3321,11 +3316,13 @@ class TransferCompleteField(FieldBase):
     :ivar upload: True if the transfer was an upload, False if the transfer was a download
     """
 
+    __slots__ = ('raw', 'store', 'slot', 'upload')
     CODE = "*XFC"
+    _STRUCT = struct.Struct('>HH ?xxx')
 
     def __init__(self, raw):
         self.raw = raw
-        self.store, self.slot, self.upload = struct.unpack('>HH ?xxx', raw)
+        self.store, self.slot, self.upload = self._STRUCT.unpack(raw)
 
     def __repr__(self):
         return '<*transfer-complete: store={} slot={} upload={}>'.format(self.store, self.slot, self.upload)